@@ -4,11 +4,20 @@ Test Runner Script for Doxygen Comment Generator
 Runs tests with optional coverage reporting and attractive output formatting.
 """
 
+import io
+import os
 import sys
 import subprocess
 import argparse
-import platform
-from pathlib import Path
+import importlib
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
+
+
+# Repository root (the parent of this scripts/ directory)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
 class Colors:
@@ -24,25 +33,25 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
-def get_python_command():
-    """Get the current operating system"""
-    if platform.system() == 'Windows':
-        return 'python'
-    else:
-        return 'python3'
+# Drop escape codes when output is piped or NO_COLOR is set (https://no-color.org)
+if not sys.stdout.isatty() or os.environ.get('NO_COLOR'):
+    for _attr in [a for a in vars(Colors) if not a.startswith('_')]:
+        setattr(Colors, _attr, '')
+
+
+BANNER_WIDTH = 70
+_BAR_EQ = '=' * BANNER_WIDTH
+_BAR_DASH = '─' * BANNER_WIDTH
+
 
 def print_banner(text, color=Colors.OKBLUE):
     """Print a formatted banner"""
-    width = 70
-    print(f"\n{color}{'=' * width}")
-    print(f"{text.center(width)}")
-    print(f"{'=' * width}{Colors.ENDC}\n")
+    sys.stdout.write(f"\n{color}{_BAR_EQ}\n{text.center(BANNER_WIDTH)}\n{_BAR_EQ}{Colors.ENDC}\n\n")
 
 
 def print_section(text, color=Colors.OKCYAN):
     """Print a section header"""
-    print(f"\n{color}{Colors.BOLD}▶ {text}{Colors.ENDC}")
-    print(f"{color}{'─' * 70}{Colors.ENDC}")
+    sys.stdout.write(f"\n{color}{Colors.BOLD}▶ {text}{Colors.ENDC}\n{color}{_BAR_DASH}{Colors.ENDC}\n")
 
 
 def print_success(text):
@@ -61,12 +70,11 @@ def print_info(text):
 
 
 def run_command(cmd, description):
-    """Run a shell command and return the result"""
+    """Run a command given as an argument list and return the result"""
     print_info(f"{description}...")
     try:
         result = subprocess.run(
             cmd,
-            shell=True,
             check=True,
             capture_output=False,
             text=True
@@ -76,19 +84,26 @@ def run_command(cmd, description):
         return False
 
 
+# Import name of each package install_dependencies() may install
+PACKAGE_MODULES = {
+    'pytest': 'pytest',
+    'pytest-xdist': 'xdist',
+    'pytest-cov': 'pytest_cov',
+}
+
+
+@lru_cache(maxsize=None)
+def _has(module):
+    """Check whether a module is importable, without importing it"""
+    return find_spec(module) is not None
+
+
 def check_dependencies():
     """Check if required dependencies are installed"""
     print_section("Checking Dependencies", Colors.OKCYAN)
 
     # Check pytest
-    result = subprocess.run(
-        get_python_command() + ' -m pytest --version',
-        shell=True,
-        capture_output=True,
-        text=True
-    )
-
-    pytest_installed = result.returncode == 0
+    pytest_installed = _has('pytest')
 
     if pytest_installed:
         print_success("pytest is available")
@@ -96,14 +111,7 @@ def check_dependencies():
         print_error("pytest is not installed")
 
     # Check pytest-cov (optional)
-    result_cov = subprocess.run(
-        get_python_command() + ' -c "import pytest_cov" 2>/dev/null',
-        shell=True,
-        capture_output=True,
-        text=True
-    )
-
-    if result_cov.returncode == 0:
+    if _has('pytest_cov'):
         print_success("pytest-cov is available")
     else:
         print_info("pytest-cov is not installed (optional for coverage)")
@@ -111,26 +119,40 @@ def check_dependencies():
     return pytest_installed
 
 
+def check_xdist():
+    """Check if pytest-xdist is installed for parallel test runs"""
+    return _has('xdist')
+
+
 def install_dependencies(with_coverage=False):
-    """Install pytest and optionally pytest-cov"""
+    """Install pytest, pytest-xdist and optionally pytest-cov"""
     print_section("Installing Test Dependencies", Colors.OKCYAN)
 
-    packages = ['pytest']
+    packages = ['pytest', 'pytest-xdist']
     if with_coverage:
         packages.append('pytest-cov')
 
-    cmd = f"{get_python_command()} -m pip install {' '.join(packages)}"
+    # Only hand pip the packages that are actually missing
+    packages = [p for p in packages if not _has(PACKAGE_MODULES[p])]
+    if not packages:
+        print_success("All dependencies already present")
+        return True
+
+    # One pip call for everything missing; skip pip's self-update check and prompts
+    cmd = [sys.executable, '-m', 'pip', 'install', '--disable-pip-version-check', '--no-input'] + packages
     print_info(f"Installing {', '.join(packages)}...")
 
     result = subprocess.run(
         cmd,
-        shell=True,
         capture_output=True,
         text=True
     )
 
     if result.returncode == 0:
         print_success(f"Successfully installed {', '.join(packages)}")
+        # Forget cached lookups so the new packages are seen
+        importlib.invalidate_caches()
+        _has.cache_clear()
         return True
     else:
         print_error("Failed to install dependencies")
@@ -141,50 +163,92 @@ def install_dependencies(with_coverage=False):
         return False
 
 
-def run_tests_with_unittest(test_path=None):
+def _iter_all_tests(suite):
+    """Flatten a nested unittest suite into individual test cases"""
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _iter_all_tests(test)
+        else:
+            yield test
+
+
+def _run_unittest_shard(test_ids, top_level_dir):
+    """Run a shard of unittest test IDs in a worker process"""
+    if top_level_dir not in sys.path:
+        sys.path.insert(0, top_level_dir)
+    stream = io.StringIO()
+    suite = unittest.TestLoader().loadTestsFromNames(test_ids)
+    result = unittest.TextTestRunner(stream=stream, verbosity=2).run(suite)
+    return (result.testsRun, len(result.failures), len(result.errors),
+            result.wasSuccessful(), stream.getvalue())
+
+
+def run_tests_with_unittest(test_path=None, jobs=None):
     """Run tests using unittest as fallback"""
     print_section("Running Tests with unittest", Colors.OKBLUE)
     print_info("pytest not found, falling back to unittest\n")
 
-    import os
-    import unittest
-
     # Determine test path
     if test_path:
         test_location = test_path
     else:
         test_location = 'tests'
 
-    # Discover and run tests
+    # Discover tests
     loader = unittest.TestLoader()
     if os.path.isfile(test_location):
         # Load specific test file
-        suite = loader.discover(os.path.dirname(test_location),
-                               pattern=os.path.basename(test_location))
+        start_dir = os.path.dirname(test_location)
+        suite = loader.discover(start_dir, pattern=os.path.basename(test_location))
     else:
         # Load all tests from directory
-        suite = loader.discover(test_location, pattern='test_*.py')
-
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+        start_dir = test_location
+        suite = loader.discover(start_dir, pattern='test_*.py')
+
+    test_ids = [test.id() for test in _iter_all_tests(suite)]
+    workers = jobs if jobs is not None else max(1, (os.cpu_count() or 1) - 2)
+    workers = min(workers, len(test_ids))
+
+    # Import errors are only reported properly by the suite that hit them, so run serially then
+    if workers <= 1 or loader.errors:
+        result = unittest.TextTestRunner(verbosity=2).run(suite)
+        tests_run, failures, errors = result.testsRun, len(result.failures), len(result.errors)
+        success = result.wasSuccessful()
+    else:
+        # Contiguous shards keep each test class on one worker
+        print_info(f"Running {len(test_ids)} tests on {workers} workers\n")
+        shard_size = -(-len(test_ids) // workers)
+        shards = [test_ids[k:k + shard_size] for k in range(0, len(test_ids), shard_size)]
+        top_level_dir = os.path.abspath(start_dir or '.')
+        tests_run = failures = errors = 0
+        success = True
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for shard_run, shard_failures, shard_errors, shard_ok, output in executor.map(
+                    _run_unittest_shard, shards, [top_level_dir] * len(shards)):
+                sys.stderr.write(output)
+                tests_run += shard_run
+                failures += shard_failures
+                errors += shard_errors
+                success = success and shard_ok
 
     # Print results
     print_section("Test Results", Colors.OKBLUE)
 
-    if result.wasSuccessful():
+    if success:
         print_success(f"All tests passed! ✨")
-        print_success(f"Ran {result.testsRun} tests")
+        print_success(f"Ran {tests_run} tests")
         print_banner("SUCCESS", Colors.OKGREEN)
         return True
     else:
         print_error(f"Some tests failed")
-        print_info(f"Failures: {len(result.failures)}")
-        print_info(f"Errors: {len(result.errors)}")
+        print_info(f"Failures: {failures}")
+        print_info(f"Errors: {errors}")
         print_banner("FAILED", Colors.FAIL)
         return False
 
 
-def run_tests(with_coverage=False, verbose=False, test_path=None, auto_install=False):
+def run_tests(with_coverage=False, verbose=False, test_path=None, auto_install=False, jobs=None,
+              keep_cache=False):
     """Run the test suite"""
     print_banner("🧪 DOXYGEN COMMENT GENERATOR TEST SUITE 🧪", Colors.HEADER)
 
@@ -197,34 +261,48 @@ def run_tests(with_coverage=False, verbose=False, test_path=None, auto_install=F
             if not install_dependencies(with_coverage=with_coverage):
                 print_error("\nFailed to install dependencies automatically.")
                 print_info("Falling back to unittest...")
-                return run_tests_with_unittest(test_path)
+                return run_tests_with_unittest(test_path, jobs)
             print()
             # Re-check after installation
             pytest_available = True
         else:
             print_info("\npytest not installed. Use --install-deps to install it.")
             print_info("Falling back to unittest (coverage not available)...\n")
-            return run_tests_with_unittest(test_path)
+            return run_tests_with_unittest(test_path, jobs)
 
-    # Build pytest command
-    cmd_parts = [get_python_command(), '-m', 'pytest']
+    # Build pytest arguments (pytest runs in this interpreter, see below)
+    pytest_args = []
 
     # Add test path if specified
     if test_path:
-        cmd_parts.append(test_path)
+        pytest_args.append(test_path)
     else:
-        cmd_parts.append('tests/')
+        pytest_args.append('tests/')
 
     # Add verbosity
     if verbose:
-        cmd_parts.append('-v')
+        pytest_args.append('-v')
     else:
-        cmd_parts.append('-v')  # Always use verbose for better output
+        pytest_args.append('-v')  # Always use verbose for better output
+
+    # Distribute tests across CPU cores; loadfile keeps a file's tests on one worker
+    if check_xdist():
+        pytest_args.extend(['-p', 'xdist.plugin', '-n', 'auto' if jobs is None else str(jobs), '--dist', 'loadfile'])
+    else:
+        print_info("pytest-xdist not installed, running tests serially")
+
+    # Import test modules with importlib instead of inserting rootdirs into sys.path
+    pytest_args.append('--import-mode=importlib')
+
+    # Skip .pytest_cache writes unless asked to keep the cache
+    if not keep_cache and not with_coverage:
+        pytest_args.extend(['-p', 'no:cacheprovider'])
 
     # Add coverage options
     if with_coverage:
         print_section("Running Tests with Coverage", Colors.OKBLUE)
-        cmd_parts.extend([
+        pytest_args.extend([
+            '-p', 'pytest_cov.plugin',
             '--cov=src',
             '--cov-report=term-missing',
             '--cov-report=html:htmlcov',
@@ -233,20 +311,34 @@ def run_tests(with_coverage=False, verbose=False, test_path=None, auto_install=F
     else:
         print_section("Running Tests", Colors.OKBLUE)
 
-    # Add color output
-    cmd_parts.append('--color=yes')
+    # Let pytest colorize only when writing to a terminal, like the output above
+    pytest_args.append('--color=auto')
 
-    # Build final command
-    cmd = ' '.join(cmd_parts)
+    # Run tests in this interpreter to skip a second start-up
+    print_info(f"Command: {' '.join([sys.executable, '-m', 'pytest'] + pytest_args)}\n")
+    try:
+        import pytest
+    except ImportError:
+        print_error("pytest could not be imported after installation; rerun the test script")
+        print_banner("FAILED", Colors.FAIL)
+        return False
 
-    # Run tests
-    print_info(f"Command: {cmd}\n")
-    result = subprocess.run(cmd, shell=True)
+    # Plugins we need are loaded with -p above; skip scanning every installed pytest11
+    # entry point, for this run only
+    previous_autoload = os.environ.get('PYTEST_DISABLE_PLUGIN_AUTOLOAD')
+    os.environ['PYTEST_DISABLE_PLUGIN_AUTOLOAD'] = '1'
+    try:
+        returncode = pytest.main(pytest_args)
+    finally:
+        if previous_autoload is None:
+            del os.environ['PYTEST_DISABLE_PLUGIN_AUTOLOAD']
+        else:
+            os.environ['PYTEST_DISABLE_PLUGIN_AUTOLOAD'] = previous_autoload
 
     # Print results
     print_section("Test Results", Colors.OKBLUE)
 
-    if result.returncode == 0:
+    if returncode == 0:
         print_success("All tests passed! ✨")
         if with_coverage:
             print_info("Coverage report generated in: htmlcov/index.html")
@@ -270,8 +362,10 @@ Examples:
   %(prog)s --coverage         # Run tests with coverage report (requires pytest)
   %(prog)s -c -v              # Run with coverage and verbose output
   %(prog)s tests/test_generator.py  # Run specific test file
-  %(prog)s --install-deps     # Install pytest and pytest-cov, then run tests
+  %(prog)s --install-deps     # Install pytest and pytest-xdist, then run tests
   %(prog)s --auto-install     # Auto-install pytest if missing
+  %(prog)s --jobs 4           # Run tests on 4 parallel workers
+  %(prog)s --keep-cache       # Keep .pytest_cache (e.g. for --lf / --ff reruns)
 
 Note: The script uses unittest as fallback if pytest is not installed.
       Use --install-deps or --auto-install to install pytest automatically.
@@ -299,7 +393,7 @@ Note: The script uses unittest as fallback if pytest is not installed.
     parser.add_argument(
         '--install-deps',
         action='store_true',
-        help='Automatically install pytest/pytest-cov if missing and run tests'
+        help='Automatically install pytest/pytest-xdist (and pytest-cov with --coverage) if missing and run tests'
     )
 
     parser.add_argument(
@@ -308,13 +402,22 @@ Note: The script uses unittest as fallback if pytest is not installed.
         help='Automatically install pytest if missing (same as --install-deps)'
     )
 
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        help='Number of parallel test workers, for pytest-xdist or the unittest fallback (default: auto)'
+    )
+
+    parser.add_argument(
+        '--keep-cache',
+        action='store_true',
+        help='Keep the pytest cache provider enabled (disabled by default for faster runs)'
+    )
+
     args = parser.parse_args()
 
     # Change to project root directory
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
-    import os
-    os.chdir(project_root)
+    os.chdir(PROJECT_ROOT)
 
     # Determine if we should auto-install
     auto_install = args.install_deps or args.auto_install
@@ -324,7 +427,9 @@ Note: The script uses unittest as fallback if pytest is not installed.
         with_coverage=args.coverage,
         verbose=args.verbose,
         test_path=args.test_path,
-        auto_install=auto_install
+        auto_install=auto_install,
+        jobs=args.jobs,
+        keep_cache=args.keep_cache
     )
 
     return 0 if success else 1
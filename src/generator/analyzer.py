@@ -8,6 +8,38 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 
+# Framework-specific includes, checked in this order by detect_test_framework
+_FRAMEWORK_INCLUDE_RES = (
+    ('gtest', re.compile(r'#include\s*[<"]gtest/gtest\.h[>"]')),
+    ('catch2', re.compile(r'#include\s*[<"]catch2?/catch.*\.hpp[>"]')),
+    ('doctest', re.compile(r'#include\s*[<"]doctest/doctest\.h[>"]')),
+    ('boost', re.compile(r'#include\s*[<"]boost/test/')),
+    ('cppunit', re.compile(r'#include\s*[<"]cppunit/')),
+)
+
+# CppUnit registration macros and test method definitions
+_CPPUNIT_TEST_RE = re.compile(r'CPPUNIT_TEST\s*\(\s*(\w+)\s*\)')
+_CPPUNIT_SUITE_RE = re.compile(r'CPPUNIT_TEST_SUITE\s*\(\s*(\w+)\s*\)')
+_CPPUNIT_METHOD_RE = re.compile(r'void\s+(test\w+)\s*\(\s*\)')
+
+_CAMEL_RE = re.compile(r'([A-Z])')
+
+# Common test-name prefixes and their meanings: (pattern tried on the lowercased
+# name, same pattern for case-insensitive replacement, replacement)
+_TEST_NAME_PREFIXES = tuple(
+    (re.compile(pattern), re.compile(pattern, re.IGNORECASE), replacement)
+    for pattern, replacement in (
+        (r'^test\s+', 'Tests '),
+        (r'^when\s+', 'When '),
+        (r'^should\s+', 'Should '),
+        (r'^verify\s+', 'Verifies '),
+        (r'^check\s+', 'Checks '),
+        (r'^ensure\s+', 'Ensures '),
+        (r'^validate\s+', 'Validates '),
+    )
+)
+
+
 @dataclass
 class TestInfo:
     """Information about a detected test case."""
@@ -95,6 +127,21 @@ class TestCaseAnalyzer:
         ]
     }
 
+    # The pattern lists above compiled once with the class; parse_test_case
+    # tries them on every line of a test file
+    _GTEST_RES = tuple(map(re.compile, GTEST_PATTERNS))
+    _CATCH2_RES = tuple(map(re.compile, CATCH2_PATTERNS))
+    _DOCTEST_RES = tuple(map(re.compile, DOCTEST_PATTERNS))
+    _BOOST_RES = tuple(map(re.compile, BOOST_PATTERNS))
+    _CPPUNIT_RES = tuple(map(re.compile, CPPUNIT_PATTERNS))
+    # Assertion patterns that are plain names are found with a substring test;
+    # anything else is kept as a compiled regex
+    _ASSERTION_MATCHERS = {
+        framework: tuple((pattern, None if re.escape(pattern) == pattern else re.compile(pattern))
+                         for pattern in patterns)
+        for framework, patterns in ASSERTION_PATTERNS.items()
+    }
+
     def __init__(self):
         """Initialize the TestCaseAnalyzer."""
         pass
@@ -109,35 +156,29 @@ class TestCaseAnalyzer:
         Returns:
             Framework name ('gtest', 'catch2', 'doctest', 'boost', 'cppunit') or None
         """
-        content = '\n'.join(lines)
-
-        # Check for framework-specific includes or macros
-        if re.search(r'#include\s*[<"]gtest/gtest\.h[>"]', content):
-            return 'gtest'
-        if re.search(r'#include\s*[<"]catch2?/catch.*\.hpp[>"]', content):
-            return 'catch2'
-        if re.search(r'#include\s*[<"]doctest/doctest\.h[>"]', content):
-            return 'doctest'
-        if re.search(r'#include\s*[<"]boost/test/', content):
-            return 'boost'
-        if re.search(r'#include\s*[<"]cppunit/', content):
-            return 'cppunit'
+        # Check for framework-specific includes. Only the #include lines are
+        # joined, so a copy of the whole file is made only for the macro scan.
+        includes = '\n'.join(line for line in lines if '#include' in line)
+        for framework, include_re in _FRAMEWORK_INCLUDE_RES:
+            if include_re.search(includes):
+                return framework
 
         # Check for framework-specific macros
-        for pattern in self.GTEST_PATTERNS:
-            if re.search(pattern, content):
+        content = '\n'.join(lines)
+        for pattern in self._GTEST_RES:
+            if pattern.search(content):
                 return 'gtest'
 
-        for pattern in self.CATCH2_PATTERNS:
-            if re.search(pattern, content):
+        for pattern in self._CATCH2_RES:
+            if pattern.search(content):
                 return 'catch2'
 
-        for pattern in self.BOOST_PATTERNS:
-            if re.search(pattern, content):
+        for pattern in self._BOOST_RES:
+            if pattern.search(content):
                 return 'boost'
 
-        for pattern in self.CPPUNIT_PATTERNS:
-            if re.search(pattern, content):
+        for pattern in self._CPPUNIT_RES:
+            if pattern.search(content):
                 return 'cppunit'
 
         return None
@@ -169,8 +210,7 @@ class TestCaseAnalyzer:
 
     def _parse_gtest_case(self, lines: List[str], start_idx: int, line: str) -> Optional[Tuple[TestInfo, int]]:
         """Parse Google Test case."""
-        for pattern_str in self.GTEST_PATTERNS:
-            pattern = re.compile(pattern_str)
+        for pattern in self._GTEST_RES:
             match = pattern.search(line)
             if match:
                 # Determine test type
@@ -198,10 +238,9 @@ class TestCaseAnalyzer:
 
     def _parse_catch_doctest_case(self, lines: List[str], start_idx: int, line: str, framework: str) -> Optional[Tuple[TestInfo, int]]:
         """Parse Catch2/doctest test case."""
-        patterns = self.CATCH2_PATTERNS if framework == 'catch2' else self.DOCTEST_PATTERNS
+        patterns = self._CATCH2_RES if framework == 'catch2' else self._DOCTEST_RES
 
-        for pattern_str in patterns:
-            pattern = re.compile(pattern_str)
+        for pattern in patterns:
             match = pattern.search(line)
             if match:
                 test_type = line.split('(')[0].strip()
@@ -225,8 +264,7 @@ class TestCaseAnalyzer:
 
     def _parse_boost_case(self, lines: List[str], start_idx: int, line: str) -> Optional[Tuple[TestInfo, int]]:
         """Parse Boost.Test case."""
-        for pattern_str in self.BOOST_PATTERNS:
-            pattern = re.compile(pattern_str)
+        for pattern in self._BOOST_RES:
             match = pattern.search(line)
             if match:
                 test_type = line.split('(')[0].strip()
@@ -251,8 +289,7 @@ class TestCaseAnalyzer:
     def _parse_cppunit_case(self, lines: List[str], start_idx: int, line: str) -> Optional[Tuple[TestInfo, int]]:
         """Parse CppUnit test case."""
         # CPPUNIT_TEST macro in test suite definition
-        cppunit_test_pattern = re.compile(r'CPPUNIT_TEST\s*\(\s*(\w+)\s*\)')
-        match = cppunit_test_pattern.search(line)
+        match = _CPPUNIT_TEST_RE.search(line)
         if match:
             test_name = match.group(1)
             # This is just a registration macro, actual test is a method
@@ -266,16 +303,14 @@ class TestCaseAnalyzer:
             return test_info, start_idx
 
         # CPPUNIT_TEST_SUITE declaration
-        suite_pattern = re.compile(r'CPPUNIT_TEST_SUITE\s*\(\s*(\w+)\s*\)')
-        match = suite_pattern.search(line)
+        match = _CPPUNIT_SUITE_RE.search(line)
         if match:
             # This starts a test suite, skip it
             return None
 
         # Test method definition (void testXXX())
         # Look for methods starting with 'test' in a CppUnit test class
-        test_method_pattern = re.compile(r'void\s+(test\w+)\s*\(\s*\)')
-        match = test_method_pattern.search(line)
+        match = _CPPUNIT_METHOD_RE.search(line)
         if match:
             test_name = match.group(1)
             body_start, body_end = self._find_test_body(lines, start_idx)
@@ -336,12 +371,12 @@ class TestCaseAnalyzer:
             List of assertion types found
         """
         assertions = []
-        patterns = self.ASSERTION_PATTERNS.get(framework, [])
+        matchers = self._ASSERTION_MATCHERS.get(framework, ())
 
         body_text = '\n'.join(body_lines)
 
-        for pattern in patterns:
-            if re.search(pattern, body_text):
+        for pattern, regex in matchers:
+            if regex.search(body_text) if regex else pattern in body_text:
                 assertions.append(pattern)
 
         return assertions
@@ -365,23 +400,13 @@ class TestCaseAnalyzer:
             readable = test_name.replace('_', ' ')
         else:
             # CamelCase: TestFunctionReturnsTrue -> Test Function Returns True
-            readable = re.sub(r'([A-Z])', r' \1', test_name).strip()
-
-        # Common test prefixes and their meanings
-        test_patterns = {
-            r'^test\s+': 'Tests ',
-            r'^when\s+': 'When ',
-            r'^should\s+': 'Should ',
-            r'^verify\s+': 'Verifies ',
-            r'^check\s+': 'Checks ',
-            r'^ensure\s+': 'Ensures ',
-            r'^validate\s+': 'Validates ',
-        }
+            readable = _CAMEL_RE.sub(r' \1', test_name).strip()
 
         description = readable
-        for pattern, replacement in test_patterns.items():
-            if re.search(pattern, readable.lower()):
-                description = re.sub(pattern, replacement, description, flags=re.IGNORECASE)
+        readable_lower = readable.lower()
+        for prefix_re, prefix_re_nocase, replacement in _TEST_NAME_PREFIXES:
+            if prefix_re.search(readable_lower):
+                description = prefix_re_nocase.sub(replacement, description)
                 break
         else:
             # If no pattern matched, add "Tests " prefix if not already present
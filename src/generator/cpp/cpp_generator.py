@@ -3,12 +3,43 @@ C++ Source File Doxygen Comment Generator
 Handles .cpp, .cc, .cxx files including test files with intelligent test case documentation.
 """
 
-import re
-from typing import List, Dict, Optional, Tuple
-from ..header.header_generator import HeaderDoxygenGenerator
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
+from ..header.header_generator import HeaderDoxygenGenerator, _parse_in_processes, _trim_trailing_blank_lines
 from ..analyzer import TestCaseAnalyzer, TestInfo
 
 
+# File extensions accepted by parse_source (header and source files)
+_SUPPORTED_EXTENSIONS = frozenset({'h', 'hpp', 'hh', 'hxx', 'cpp', 'cc', 'cxx', 'c++'})
+
+
+# Display names of the supported test frameworks
+_FRAMEWORK_NAMES = {
+    'gtest': 'Google Test',
+    'catch2': 'Catch2',
+    'doctest': 'doctest',
+    'boost': 'Boost.Test',
+    'cppunit': 'CppUnit'
+}
+
+
+@lru_cache(maxsize=32)
+def _test_comment_frame(indent: str) -> Tuple[str, str, str, str, str]:
+    """
+    Fixed lines of a test case comment for one indentation, built once per indent.
+
+    Returns:
+        (opening, separator, details, coverage header, closing) lines
+    """
+    return (f'{indent}/**\n', f'{indent} *\n', f'{indent} * @details\n',
+            f'{indent} * Test Coverage:\n', f'{indent} */\n')
+
+
+def _parse_source_worker(filename: str, enhance_existing: bool) -> List[str]:
+    """Parse one file with a fresh generator, so no per-file state crosses process boundaries."""
+    return CppSourceGenerator(enhance_existing=enhance_existing).parse_source(filename)
+
+
 class CppSourceGenerator(HeaderDoxygenGenerator):
     """
     Generates Doxygen comments for C++ source files (.cpp, .cc, .cxx).
@@ -41,13 +72,29 @@ class CppSourceGenerator(HeaderDoxygenGenerator):
             ValueError: If the file extension is not a supported C++ source file.
         """
         # Support both header and source file extensions
-        ext = filename.split('.')[-1].lower()
-        if ext not in ["h", "hpp", "hh", "hxx", "cpp", "cc", "cxx", "c++"]:
+        ext = filename.rpartition('.')[2].lower()
+        if ext not in _SUPPORTED_EXTENSIONS:
             raise ValueError("Only C++ header and source files are supported")
 
+        # One read and one split instead of line-by-line readline calls
         with open(filename, 'r') as f:
-            lines = f.readlines()
+            lines = f.read().splitlines(keepends=True)
+
+        return self.parse_source_from_lines(lines)
+
+    def parse_source_from_lines(self, lines: List[str]) -> List[str]:
+        """
+        Add Doxygen comments to already loaded C++ source lines.
+
+        Lets callers that already hold a file's contents skip re-reading it.
+        Test files are detected from the lines as in parse_source.
 
+        Args:
+            lines (List[str]): Lines of the file, each keeping its newline.
+
+        Returns:
+            List[str]: List of lines with Doxygen comments inserted.
+        """
         # Detect if this is a test file
         self.detected_framework = self.test_analyzer.detect_test_framework(lines)
         self.is_test_file = self.detected_framework is not None
@@ -59,6 +106,25 @@ class CppSourceGenerator(HeaderDoxygenGenerator):
             # Use standard header parsing for regular source files
             return self.parse_header_internal(lines)
 
+    def parse_files(self, filenames: Iterable[str], jobs: Optional[int] = None) -> Iterator[List[str]]:
+        """
+        Parse several C++ files in parallel worker processes.
+
+        Each file is parsed by a fresh generator in a worker, so per-file state
+        (detected_framework, current_class, ...) is not updated on this instance.
+
+        Args:
+            filenames (Iterable[str]): Paths to the header or source files.
+            jobs (Optional[int]): Number of worker processes (None = all CPUs but two).
+
+        Yields:
+            List[str]: Lines with Doxygen comments for each file, in input order.
+
+        Raises:
+            ValueError: If a file extension is not a supported C++ file.
+        """
+        return _parse_in_processes(_parse_source_worker, filenames, self.enhance_existing, jobs)
+
     def parse_header_internal(self, lines: List[str]) -> List[str]:
         """
         Internal method to parse lines without file validation.
@@ -70,232 +136,7 @@ class CppSourceGenerator(HeaderDoxygenGenerator):
         Returns:
             List[str]: Lines with Doxygen comments
         """
-        output = []
-        i = 0
-        inside_class = False
-        class_brace_depth = 0
-        last_was_decl = False
-
-        # Main parsing loop
-        while i < len(lines):
-            line = lines[i].rstrip('\n')
-            stripped = line.strip()
-
-            # Skip empty lines (preserve formatting)
-            if not stripped:
-                output.append(lines[i])
-                last_was_decl = False
-                i += 1
-                continue
-
-            # Skip existing Doxygen comments (do not duplicate)
-            if stripped.startswith('/**') or stripped.startswith('///') or stripped.startswith('/*!'):
-                while i < len(lines) and '*/' not in lines[i]:
-                    output.append(lines[i])
-                    i += 1
-                if i < len(lines):
-                    output.append(lines[i])
-                    i += 1
-                last_was_decl = False
-                continue
-
-            # Handle namespace declaration (track for context)
-            namespace_match = re.match(r'namespace\s+(\w+)\s*\{', stripped)
-            if namespace_match:
-                self.current_namespace = namespace_match.group(1)
-                if output and output[-1].strip():
-                    output.append('\n')
-                output.append(lines[i])
-                last_was_decl = True
-                i += 1
-                continue
-
-            # Class detection and handling (same as header)
-            class_decl_lines = []
-            class_decl_start = i
-            class_decl_found = False
-            class_type = None
-            class_name = None
-            class_decl_pattern = r'^(class|struct)\s+(\w+)(.*)$'
-            match = re.match(class_decl_pattern, stripped)
-            if match:
-                class_type = match.group(1)
-                class_name = match.group(2)
-                class_decl_lines.append(lines[i])
-                if '{' in stripped:
-                    class_decl_found = True
-                else:
-                    j = i + 1
-                    while j < len(lines):
-                        next_line = lines[j].strip()
-                        class_decl_lines.append(lines[j])
-                        if next_line.startswith('//') or next_line.startswith('/*'):
-                            break
-                        if '{' in next_line:
-                            class_decl_found = True
-                            break
-                        if ';' in next_line:
-                            break
-                        j += 1
-
-            if class_decl_found and class_type and class_name:
-                self.current_class = class_name
-                inside_class = True
-                class_brace_depth = 1
-                indent = self._get_indent(class_decl_lines[0])
-                if output and output[-1].strip():
-                    output.append('\n')
-                doc_comment = self._generate_class_comment(class_name, class_type, indent)
-                output.extend(doc_comment)
-                for l in class_decl_lines:
-                    output.append(l)
-                output.append('\n')
-                i = class_decl_start + len(class_decl_lines)
-                last_was_decl = True
-
-                # Process class body (same as header)
-                prev_access_specifier_line = None
-                in_function_body = 0
-                while i < len(lines) and inside_class:
-                    line = lines[i].rstrip('\n')
-                    stripped = line.strip()
-                    class_brace_depth += stripped.count('{')
-                    class_brace_depth -= stripped.count('}')
-
-                    # Handle access specifiers - output immediately and mark for next declaration
-                    if re.match(r'^(public|private|protected)\s*:\s*$', stripped):
-                        output.append(lines[i])
-                        prev_access_specifier_line = True  # Mark that we just output an access specifier
-                        i += 1
-                        last_was_decl = False
-                        continue
-
-                    # Track if inside a function body - skip all processing until we exit
-                    if in_function_body > 0:
-                        in_function_body += stripped.count('{')
-                        in_function_body -= stripped.count('}')
-                        output.append(lines[i])
-                        i += 1
-                        continue
-
-                    # Skip blank lines and simple lines that can't be function declarations
-                    if not stripped or stripped.startswith('//') or stripped.startswith('#'):
-                        output.append(lines[i])
-                        i += 1
-                        continue
-
-                    func_match = self._match_function(stripped, lines, i)
-                    if func_match:
-                        func_decl, end_idx = func_match
-                        indent = self._get_indent(lines[i])
-                        ret_type = func_decl.get('return_type', '').strip()
-                        ret_type = re.sub(r'\b(?:virtual|inline|explicit|constexpr|static|friend|mutable|volatile|register|extern|thread_local|auto|typename|override|final)\b', '', ret_type)
-                        ret_type = re.sub(r'\s+', ' ', ret_type).strip()
-                        func_decl['return_type'] = ret_type
-
-                        # Generate and output comment with proper indentation
-                        doc_comment = self._generate_function_comment(func_decl, indent)
-                        for line_comment in doc_comment:
-                            output.append(line_comment.rstrip('\n') + '\n')
-
-                        # Output the function declaration
-                        for idx in range(i, end_idx + 1):
-                            output.append(lines[idx])
-                        if '{' in ''.join(lines[i:end_idx+1]):
-                            in_function_body = 1
-                        i = end_idx + 1
-                        last_was_decl = True
-                        prev_access_specifier_line = None  # Reset after processing
-                        continue
-
-                    var_match = self._match_variable(stripped, lines, i)
-                    if var_match:
-                        var_decl, end_idx = var_match
-                        indent = self._get_indent(lines[i])
-                        if output and output[-1].strip():
-                            output.append('\n')
-                        if var_decl.get('type'):
-                            for spec in ('public:', 'private:', 'protected:'):
-                                if var_decl['type'].startswith(spec):
-                                    var_decl['type'] = var_decl['type'][len(spec):].strip()
-                        doc_comment = self._generate_variable_comment(var_decl, indent)
-                        if doc_comment:
-                            output.extend(doc_comment)
-                        for idx in range(i, end_idx + 1):
-                            output.append(lines[idx])
-                        output.append('\n')
-                        i = end_idx + 1
-                        last_was_decl = True
-                        continue
-
-                    if class_brace_depth == 0:
-                        inside_class = False
-                        self.current_class = None
-                        output.append(lines[i])
-                        output.append('\n')
-                        i += 1
-                        last_was_decl = True
-                        break
-
-                    output.append(lines[i])
-                    i += 1
-                    last_was_decl = False
-
-                continue
-
-            # Handle function definitions (outside class) - common in .cpp files
-            func_match = self._match_function(stripped, lines, i)
-            if func_match:
-                func_decl, end_idx = func_match
-                indent = self._get_indent(lines[i])
-                if output and output[-1].strip():
-                    output.append('\n')
-                doc_comment = self._generate_function_comment(func_decl, indent)
-                output.extend(doc_comment)
-                for idx in range(i, end_idx + 1):
-                    output.append(lines[idx])
-                output.append('\n')
-                i = end_idx + 1
-                last_was_decl = True
-                continue
-
-            # Handle enum declaration
-            enum_match = re.match(r'enum\s+(?:class\s+)?(\w+)\s*(?::\s*\w+)?\s*\{', stripped)
-            if enum_match:
-                indent = self._get_indent(lines[i])
-                if output and output[-1].strip():
-                    output.append('\n')
-                doc_comment = self._generate_enum_comment(enum_match.group(1), indent)
-                output.extend(doc_comment)
-                output.append(lines[i])
-                output.append('\n')
-                i += 1
-                last_was_decl = True
-                continue
-
-            # Handle closing braces for namespace/class
-            if stripped == '}' and (self.current_class or self.current_namespace):
-                if ';' in stripped:
-                    if self.current_class:
-                        self.current_class = None
-                    else:
-                        self.current_namespace = None
-                output.append(lines[i])
-                output.append('\n')
-                i += 1
-                last_was_decl = True
-                continue
-
-            # Regular line - just add it
-            output.append(lines[i])
-            last_was_decl = False
-            i += 1
-
-        # Remove trailing blank lines for clean output
-        while output and not output[-1].strip():
-            output.pop()
-        output.append('\n')
-        return output
+        return self.parse_header_from_lines(lines)
 
     def _parse_test_file(self, lines: List[str]) -> List[str]:
         """
@@ -309,25 +150,20 @@ class CppSourceGenerator(HeaderDoxygenGenerator):
         """
         output = []
         i = 0
+        # Unchanged lines are copied in runs: lines[run_start:i] is pending output
+        run_start = 0
 
         while i < len(lines):
-            line = lines[i].rstrip('\n')
-            stripped = line.strip()
+            stripped = lines[i].strip()
 
             # Skip empty lines
             if not stripped:
-                output.append(lines[i])
                 i += 1
                 continue
 
             # Skip existing Doxygen comments
-            if stripped.startswith('/**') or stripped.startswith('///') or stripped.startswith('/*!'):
-                while i < len(lines) and '*/' not in lines[i]:
-                    output.append(lines[i])
-                    i += 1
-                if i < len(lines):
-                    output.append(lines[i])
-                    i += 1
+            if stripped.startswith(self.DOXYGEN_PREFIXES):
+                i = self._doxygen_comment_end(lines, i)
                 continue
 
             # Try to parse test case
@@ -335,6 +171,7 @@ class CppSourceGenerator(HeaderDoxygenGenerator):
             if test_case:
                 test_info, end_idx = test_case
                 indent = self._get_indent(lines[i])
+                output.extend(lines[run_start:i])
 
                 # Generate test case comment
                 if output and output[-1].strip():
@@ -344,22 +181,20 @@ class CppSourceGenerator(HeaderDoxygenGenerator):
                 output.extend(doc_comment)
 
                 # Add the test case lines
-                for idx in range(i, end_idx + 1):
-                    output.append(lines[idx])
+                output.extend(lines[i:end_idx + 1])
 
                 output.append('\n')
                 i = end_idx + 1
+                run_start = i
                 continue
 
             # Regular line
-            output.append(lines[i])
             i += 1
 
+        output.extend(lines[run_start:])
+
         # Remove trailing blank lines
-        while output and not output[-1].strip():
-            output.pop()
-        output.append('\n')
-        return output
+        return _trim_trailing_blank_lines(output)
 
     def _generate_test_case_comment(self, test_info: TestInfo, indent: str = "") -> List[str]:
         """
@@ -372,15 +207,16 @@ class CppSourceGenerator(HeaderDoxygenGenerator):
         Returns:
             List of comment lines
         """
-        comment = [f'{indent}/**\n']
+        opening, separator, details, coverage_header, closing = _test_comment_frame(indent)
+        comment = [opening]
 
         # Brief description
         description = self.test_analyzer.generate_test_description(test_info)
         comment.append(f'{indent} * @brief {description}\n')
-        comment.append(f'{indent} *\n')
+        comment.append(separator)
 
         # Test details
-        comment.append(f'{indent} * @details\n')
+        comment.append(details)
 
         # Test suite/fixture
         if test_info.test_suite:
@@ -391,27 +227,20 @@ class CppSourceGenerator(HeaderDoxygenGenerator):
             comment.append(f'{indent} * Test Fixture: {test_info.fixture_class}\n')
 
         # Framework
-        framework_names = {
-            'gtest': 'Google Test',
-            'catch2': 'Catch2',
-            'doctest': 'doctest',
-            'boost': 'Boost.Test',
-            'cppunit': 'CppUnit'
-        }
-        comment.append(f'{indent} * Framework: {framework_names.get(test_info.framework, test_info.framework)}\n')
+        comment.append(f'{indent} * Framework: {_FRAMEWORK_NAMES.get(test_info.framework, test_info.framework)}\n')
 
         # Coverage analysis
         coverage = self.test_analyzer.analyze_test_coverage(test_info)
         if coverage:
-            comment.append(f'{indent} *\n')
-            comment.append(f'{indent} * Test Coverage:\n')
+            comment.append(separator)
+            comment.append(coverage_header)
             for point in coverage:
                 comment.append(f'{indent} * - {point}\n')
 
         # Test type
         if test_info.test_type:
-            comment.append(f'{indent} *\n')
+            comment.append(separator)
             comment.append(f'{indent} * @test {test_info.test_type}\n')
 
-        comment.append(f'{indent} */\n')
+        comment.append(closing)
         return comment
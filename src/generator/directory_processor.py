@@ -3,12 +3,102 @@ Directory processor for batch processing C++ files.
 Recursively processes all C++ files in specified directories.
 """
 
+import hashlib
+import json
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple
 from .cpp.cpp_generator import CppSourceGenerator
 
 
+# Common non-source directories that are never descended into
+_SKIP_DIRS = frozenset({'.git', '.svn', 'build', 'cmake-build-debug', 'cmake-build-release', '__pycache__', '.venv', 'venv'})
+
+# Default incremental cache file name, and its format version
+# (bump when the cache file layout changes)
+CACHE_FILENAME = '.doxygen_gen_cache.json'
+_CACHE_VERSION = 1
+
+
+@lru_cache(maxsize=None)
+def _generator_hash() -> str:
+    """Hash of the generator package sources, so upgrading the generator discards cache entries."""
+    digest = hashlib.sha1()
+    package_dir = Path(__file__).resolve().parent
+    for path in sorted(package_dir.rglob('*.py')):
+        digest.update(path.relative_to(package_dir).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _output_path(file_path: str, directory: str, output_dir: Optional[str]) -> str:
+    """
+    Path the processed version of a file is written to.
+
+    Args:
+        file_path: Path to the C++ file
+        directory: Directory being processed (base for paths under output_dir)
+        output_dir: Optional output directory (if None, the file is modified in place)
+
+    Returns:
+        Output path for the file
+    """
+    if output_dir:
+        # Recreate directory structure in output_dir
+        return os.path.join(output_dir, os.path.relpath(file_path, directory))
+    # Write in place
+    return file_path
+
+
+def _process_file(generator: CppSourceGenerator, file_path: str, directory: str,
+                  output_dir: Optional[str], dry_run: bool) -> Tuple[bool, str]:
+    """
+    Generate comments for one file and write the result.
+
+    Args:
+        generator: Generator used to parse the file
+        file_path: Path to the C++ file
+        directory: Directory being processed (base for paths under output_dir)
+        output_dir: Optional output directory (if None, the file is modified in place)
+        dry_run: If True, don't write the file
+
+    Returns:
+        (success, message) tuple for the results dictionary
+    """
+    try:
+        # Process the file
+        output_lines = generator.parse_source(file_path)
+
+        if dry_run:
+            return (True, "Would be processed (dry run)")
+
+        # Determine output path
+        out_path = _output_path(file_path, directory, output_dir)
+        if output_dir:
+            os.makedirs(os.path.dirname(out_path), exist_ok=True)
+
+        # Write the output with a single write call instead of one per line
+        content = ''.join(output_lines)
+        with open(out_path, 'w') as f:
+            f.write(content)
+
+        framework_info = f" (Test file: {generator.detected_framework})" if generator.is_test_file else ""
+        return (True, f"Processed successfully{framework_info}")
+
+    except Exception as e:
+        return (False, f"Error: {str(e)}")
+
+
+def _process_one(args: Tuple[str, str, Optional[str], bool, bool]) -> Tuple[str, bool, str]:
+    """Process one file in a worker process with a fresh generator, so nothing is pickled but the arguments."""
+    file_path, directory, output_dir, dry_run, enhance_existing = args
+    generator = CppSourceGenerator(enhance_existing=enhance_existing)
+    success, message = _process_file(generator, file_path, directory, output_dir, dry_run)
+    return (file_path, success, message)
+
+
 class DirectoryProcessor:
     """
     Processes directories containing C++ source and header files.
@@ -17,29 +107,43 @@ class DirectoryProcessor:
 
     # Supported C++ file extensions
     CPP_EXTENSIONS = {'.h', '.hpp', '.hh', '.hxx', '.cpp', '.cc', '.cxx', '.c++'}
+    # Same extensions as a tuple, for a single str.endswith call per file name
+    _CPP_SUFFIXES = tuple(CPP_EXTENSIONS)
 
-    def __init__(self, enhance_existing: bool = False):
+    def __init__(self, enhance_existing: bool = False, jobs: int = 1, cache_path: Optional[str] = None):
         """
         Initialize the DirectoryProcessor.
 
         Args:
             enhance_existing: If True, enhance existing Doxygen comments instead of skipping them
+            jobs: Number of worker processes for directory processing
+                  (1 = process in this process, 0 = one per CPU)
+            cache_path: Optional incremental cache file; files whose size and
+                        modification time match the cache are skipped
         """
         self.enhance_existing = enhance_existing
+        self.jobs = jobs
+        self.cache_path = cache_path
+        self._cache = self._load_cache() if cache_path else {}
         self.generator = CppSourceGenerator(enhance_existing=enhance_existing)
 
-    def find_cpp_files(self, directory: str, recursive: bool = True) -> List[str]:
+    def iter_cpp_files(self, directory: str, recursive: bool = True) -> Iterator[str]:
         """
-        Find all C++ files in a directory.
+        Iterate over C++ files in a directory in discovery order.
+
+        The directory is validated immediately; files are yielded lazily while
+        the tree is walked, so processing can start before traversal ends.
 
         Args:
             directory: Path to the directory to search
             recursive: If True, search recursively in subdirectories
 
         Returns:
-            List of absolute paths to C++ files
+            Iterator over absolute paths to C++ files
+
+        Raises:
+            ValueError: If the directory does not exist or is not a directory
         """
-        cpp_files = []
         directory_path = Path(directory).resolve()
 
         if not directory_path.exists():
@@ -48,22 +152,52 @@ class DirectoryProcessor:
         if not directory_path.is_dir():
             raise ValueError(f"Path is not a directory: {directory}")
 
-        if recursive:
-            # Recursively find all C++ files
-            for root, dirs, files in os.walk(directory_path):
-                # Skip common non-source directories
-                dirs[:] = [d for d in dirs if d not in {'.git', '.svn', 'build', 'cmake-build-debug', 'cmake-build-release', '__pycache__', '.venv', 'venv'}]
+        return self._walk_cpp_files(str(directory_path), recursive)
 
-                for file in files:
-                    if Path(file).suffix.lower() in self.CPP_EXTENSIONS:
-                        cpp_files.append(str(Path(root) / file))
-        else:
-            # Only search the top-level directory
-            for file in directory_path.iterdir():
-                if file.is_file() and file.suffix.lower() in self.CPP_EXTENSIONS:
-                    cpp_files.append(str(file))
+    def _walk_cpp_files(self, directory: str, recursive: bool) -> Iterator[str]:
+        """
+        Yield C++ files below an already validated directory.
+
+        Args:
+            directory: Absolute path to the directory to search
+            recursive: If True, search recursively in subdirectories
+
+        Yields:
+            Absolute paths to C++ files
+        """
+        # Explicit scandir walk: DirEntry caches the file type from the directory
+        # read, so classifying an entry needs no extra stat call
+        pending = [directory]
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                # Unreadable directory, skipped like os.walk does
+                continue
+            subdirs = []
+            with entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Skip common non-source directories and symlinked directories
+                        if recursive and entry.name not in _SKIP_DIRS and not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif entry.name.lower().endswith(self._CPP_SUFFIXES) and entry.is_file():
+                        yield entry.path
+            # Visit subdirectories in scan order
+            pending.extend(reversed(subdirs))
+
+    def find_cpp_files(self, directory: str, recursive: bool = True) -> List[str]:
+        """
+        Find all C++ files in a directory.
+
+        Args:
+            directory: Path to the directory to search
+            recursive: If True, search recursively in subdirectories
 
-        return sorted(cpp_files)
+        Returns:
+            Sorted list of absolute paths to C++ files
+        """
+        return sorted(self.iter_cpp_files(directory, recursive=recursive))
 
     def process_directory(self, directory: str, output_dir: str = None, dry_run: bool = False, recursive: bool = True) -> Dict[str, Tuple[bool, str]]:
         """
@@ -79,42 +213,115 @@ class DirectoryProcessor:
             Dictionary mapping file paths to (success, message) tuples
         """
         results = {}
-        cpp_files = self.find_cpp_files(directory, recursive=recursive)
+        jobs = self.jobs or os.cpu_count() or 1
+
+        use_cache = self.cache_path is not None and not dry_run
+
+        # Files are processed as the walk discovers them
+        cpp_files = self.iter_cpp_files(directory, recursive=recursive)
+        if use_cache:
+            cpp_files = self._skip_unchanged(cpp_files, directory, output_dir, results)
+        if jobs > 1:
+            tasks = ((file_path, directory, output_dir, dry_run, self.enhance_existing)
+                     for file_path in cpp_files)
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                for file_path, success, message in executor.map(_process_one, tasks, chunksize=8):
+                    results[file_path] = (success, message)
+        else:
+            for file_path in cpp_files:
+                results[file_path] = _process_file(self.generator, file_path, directory, output_dir, dry_run)
+
+        if use_cache:
+            self._update_cache(results, directory, output_dir)
 
-        if not cpp_files:
+        if not results:
             return {'_info': (False, f"No C++ files found in {directory}")}
 
-        print(f"Found {len(cpp_files)} C++ file(s) to process")
+        # The count is only known once the walk is done; nothing is printed per
+        # file, so this still comes before the results listing
+        print(f"Found {len(results)} C++ file(s) to process")
+        # Files were processed in walk order, which depends on the file system;
+        # report them sorted by path
+        return dict(sorted(results.items()))
 
+    def _cache_key(self) -> str:
+        """Cache validity key: entries only apply to the same format version, generator sources and mode."""
+        return f"{_CACHE_VERSION}:{_generator_hash()}:{int(self.enhance_existing)}"
+
+    def _load_cache(self) -> Dict[str, list]:
+        """
+        Load the incremental cache, ignoring a missing, unreadable or outdated file.
+
+        Returns:
+            Dictionary mapping file paths to [mtime_ns, size, output path]
+        """
+        try:
+            with open(self.cache_path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != self._cache_key():
+            return {}
+        files = data.get('files')
+        return files if isinstance(files, dict) else {}
+
+    def _skip_unchanged(self, cpp_files: Iterator[str], directory: str, output_dir: Optional[str],
+                        results: Dict[str, Tuple[bool, str]]) -> Iterator[str]:
+        """
+        Filter out files that are unchanged since they were last processed.
+
+        Skipped files are recorded in results; all other files are yielded.
+
+        Args:
+            cpp_files: Files to process
+            directory: Directory being processed
+            output_dir: Optional output directory
+            results: Results dictionary to record skipped files in
+
+        Yields:
+            Paths of files that need processing
+        """
         for file_path in cpp_files:
+            entry = self._cache.get(file_path)
+            if entry:
+                try:
+                    st = os.stat(file_path)
+                except OSError:
+                    st = None
+                out_path = _output_path(file_path, directory, output_dir)
+                if (st is not None and entry == [st.st_mtime_ns, st.st_size, out_path]
+                        and os.path.exists(out_path)):
+                    results[file_path] = (True, "Unchanged since last run (skipped)")
+                    continue
+            yield file_path
+
+    def _update_cache(self, results: Dict[str, Tuple[bool, str]], directory: str, output_dir: Optional[str]):
+        """
+        Record successfully processed files and write the cache file.
+
+        Sizes and modification times are taken after processing, so files
+        rewritten in place are not reprocessed on the next run.
+
+        Args:
+            results: Results of this run
+            directory: Directory being processed
+            output_dir: Optional output directory
+        """
+        for file_path, (success, _) in results.items():
+            if not success:
+                self._cache.pop(file_path, None)
+                continue
             try:
-                # Process the file
-                output_lines = self.generator.parse_source(file_path)
-
-                if dry_run:
-                    results[file_path] = (True, "Would be processed (dry run)")
-                else:
-                    # Determine output path
-                    if output_dir:
-                        # Recreate directory structure in output_dir
-                        rel_path = os.path.relpath(file_path, directory)
-                        out_path = os.path.join(output_dir, rel_path)
-                        os.makedirs(os.path.dirname(out_path), exist_ok=True)
-                    else:
-                        # Write in place
-                        out_path = file_path
-
-                    # Write the output
-                    with open(out_path, 'w') as f:
-                        f.writelines(output_lines)
-
-                    framework_info = f" (Test file: {self.generator.detected_framework})" if self.generator.is_test_file else ""
-                    results[file_path] = (True, f"Processed successfully{framework_info}")
-
-            except Exception as e:
-                results[file_path] = (False, f"Error: {str(e)}")
+                st = os.stat(file_path)
+            except OSError:
+                continue
+            self._cache[file_path] = [st.st_mtime_ns, st.st_size, _output_path(file_path, directory, output_dir)]
 
-        return results
+        try:
+            with open(self.cache_path, 'w') as f:
+                json.dump({'version': self._cache_key(), 'files': self._cache}, f)
+        except OSError as e:
+            print(f"Warning: could not write cache file {self.cache_path}: {e}")
 
     def process_project(self, project_root: str, include_dirs: List[str] = None, src_dirs: List[str] = None,
                        output_dir: str = None, dry_run: bool = False) -> Dict[str, Tuple[bool, str]]:
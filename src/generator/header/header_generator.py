@@ -1,8 +1,293 @@
+import os
 import re
-from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import Callable, Iterable, Iterator, List, Dict, NamedTuple, Optional, Tuple
+
+
+# Function declaration pattern (also matches ctors/dtors), tried on every candidate line.
+# Leading specifiers (virtual, static, ...) are consumed by the generic type-token group;
+# a separate specifier group would overlap it and make failed matches backtrack quadratically.
+_FUNC_RE = re.compile(
+    r'(?:[\w:<>]+\s+)*'
+    r'(~?\w+|operator=)\s*\((.*?)\)\s*(?:const\s*)?'
+    r'(?:noexcept\s*(?:\([^)]*\))?\s*)?'
+    r'(?:\=\s*(?:default|delete|\d+))?\s*'
+)
+
+# File extensions accepted by parse_header
+_HEADER_EXTENSIONS = frozenset({'h', 'hpp', 'hh', 'hxx'})
+
+# Line classification patterns used by the parse loop
+# Namespace, class/struct and enum openers classified in a single match per line;
+# m.lastgroup names the construct ('ns', 'cls' or 'enum')
+_LINE_CLASSIFIER_RE = re.compile(
+    r'(?P<ns>namespace\s+(?P<ns_name>\w+)\s*\{)'
+    r'|(?P<cls>(?P<cls_type>class|struct)\s+(?P<cls_name>\w+))'
+    r'|(?P<enum>enum\s+(?:class\s+)?(?P<enum_name>\w+)\s*(?::\s*\w+)?\s*\{)'
+)
+# Every classifier alternative starts with one of these keywords
+_OPENER_PREFIXES = ('namespace', 'class', 'struct', 'enum')
+_ACCESS_RE = re.compile(r'^(public|private|protected)\s*:\s*$')
+
+# Return type cleanup for member functions
+_RET_TYPE_STRIP_RE = re.compile(r'\b(?:virtual|inline|explicit|constexpr|static|friend|mutable|volatile|register|extern|thread_local|auto|typename|override|final)\b')
+_LEADING_SPECIFIER_RE = re.compile(r'^(virtual|inline|explicit|constexpr|static)\s+')
+
+# Declaration details
+_DECL_PUNCT_CHARS = frozenset('{}();')
+_THROW_SPEC_RE = re.compile(r'throw\s*\((.*?)\)')
+_VAR_RE = re.compile(
+    r'(?:(?:static|constexpr|mutable|inline)\s+)?'
+    r'(?:const\s+)?'
+    r'(.+?)\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:=\s*.*)?$'
+)
+
+# Word boundaries in camelCase names
+_CAMEL_RE = re.compile(r'([A-Z])')
+
+# Common function name prefixes and the brief description they start
+# (no prefix is a prefix of another, so the order does not matter)
+_BRIEF_PREFIXES = (
+    ('get', 'Gets the '),
+    ('set', 'Sets the '),
+    ('is', 'Checks if '),
+    ('has', 'Checks if has '),
+    ('create', 'Creates a new '),
+    ('init', 'Initializes the '),
+    ('update', 'Updates the '),
+    ('delete', 'Deletes the '),
+    ('remove', 'Removes the '),
+    ('add', 'Adds a new '),
+    ('find', 'Finds the '),
+    ('calculate', 'Calculates the '),
+    ('compute', 'Computes the '),
+)
+
+
+class _ClassPatterns(NamedTuple):
+    """Special member patterns for one class name."""
+    assign: re.Pattern     # copy or move assignment operator
+    copy_ctor: re.Pattern  # const ClassName& parameter
+    move_ctor: re.Pattern  # ClassName&& parameter
+
+
+@lru_cache(maxsize=128)
+def _class_patterns(class_name: str) -> _ClassPatterns:
+    """Compile the special member patterns for a class once, instead of per declaration."""
+    name = re.escape(class_name)
+    return _ClassPatterns(
+        assign=re.compile(r'operator\s*=\s*\((const\s+' + name + r'\s*&|' + name + r'\s*&&)'),
+        copy_ctor=re.compile(r'const\s+' + name + r'\s*&'),
+        move_ctor=re.compile(name + r'\s*&&'),
+    )
+
+
+@lru_cache(maxsize=1024)
+def _function_brief(name: str) -> str:
+    """Brief description for a function name; names repeat (overloads, accessors) so cache them."""
+    # Common prefixes for function names
+    name_lower = name.lower()
+    for prefix, desc in _BRIEF_PREFIXES:
+        if name_lower.startswith(prefix):
+            rest = name[len(prefix):]
+            if not rest:
+                return desc[:-1]
+            rest_readable = _CAMEL_RE.sub(r' \1', rest)
+            rest_readable = rest_readable.replace('_', ' ')
+            rest_readable = rest_readable.lower()
+            return desc + rest_readable
+
+    # Convert camelCase or snake_case to readable text
+    readable = _CAMEL_RE.sub(r' \1', name)
+    readable = readable.replace('_', ' ')
+    return readable.lower().capitalize()
+
+
+@lru_cache(maxsize=256)
+def _ret_type_pattern(func_name: str) -> re.Pattern:
+    """Pattern capturing the return type in front of a function name."""
+    return re.compile(r'(?:(?:virtual|static|inline|explicit|constexpr)\s+)*((?:[\w:<>]+\s+)*)' + re.escape(func_name) + r'\s*\(')
+
+
+# String/char literals and comments, whose braces must not affect nesting depth
+_LITERAL_OR_COMMENT_RE = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|//.*|/\*.*?\*/')
+
+
+def _brace_delta(text: str) -> int:
+    """
+    Net brace depth change of a line: number of '{' minus number of '}'.
+    Braces inside string/char literals and comments are ignored.
+    """
+    if '{' not in text and '}' not in text:
+        return 0
+    if '"' in text or "'" in text or '/' in text:
+        text = _LITERAL_OR_COMMENT_RE.sub('', text)
+    return text.count('{') - text.count('}')
+
+
+_OPEN_BRACKETS = frozenset('([{')
+_CLOSE_BRACKETS = frozenset(')]}')
+
+
+def _opens_template(text: str, i: int) -> bool:
+    """
+    Check whether the '<' at text[i] opens a template argument list.
+
+    A template argument list follows a type name directly ('map<'); '<<', '<=' and
+    comparisons such as '1 < 2' or '1<2' in default values are operators.
+    """
+    if text[i + 1:i + 2] in ('<', '='):
+        return False
+    j = i
+    while j and (text[j - 1].isalnum() or text[j - 1] == '_'):
+        j -= 1
+    return j < i and not text[j].isdigit()
+
+
+def _template_closes_later(text: str, start: int) -> bool:
+    """
+    Check whether a '>' after text[start] closes a template argument list opened before it.
+
+    The scan stops at an unmatched closing bracket, so a '<' in a default value such as
+    'int x = a<b, int y' is not taken for a template whose '>' never comes.
+    """
+    depth = 0
+    angle_depth = 0
+    for i in range(start + 1, len(text)):
+        ch = text[i]
+        if ch in _OPEN_BRACKETS:
+            depth += 1
+        elif ch in _CLOSE_BRACKETS:
+            if not depth:
+                return False
+            depth -= 1
+        elif depth:
+            continue
+        elif ch == '<':
+            if _opens_template(text, i):
+                angle_depth += 1
+        elif ch == '>' and text[i - 1] != '-' and text[i + 1:i + 2] != '=':
+            if not angle_depth:
+                return True
+            angle_depth -= 1
+    return False
+
+
+def _split_top_level(text: str, sep: str = ',') -> List[str]:
+    """
+    Split text on sep, ignoring separators nested inside template arguments, (), [] or {}.
+
+    Args:
+        text (str): Text to split, e.g. a parameter list.
+        sep (str): Single-character separator.
+
+    Returns:
+        List[str]: Stripped top-level pieces.
+    """
+    if sep not in text:
+        return [text.strip()]
+    pieces = []
+    depth = 0
+    # Template nesting is counted apart, so a stray '>' (e.g. 'a > b') never closes a bracket.
+    # Each bracket level keeps its own count; the outer one is restored when the bracket closes.
+    angle_depth = 0
+    outer_angle_depths = []
+    start = 0
+    for i, ch in enumerate(text):
+        if ch in _OPEN_BRACKETS:
+            depth += 1
+            outer_angle_depths.append(angle_depth)
+            angle_depth = 0
+        elif ch in _CLOSE_BRACKETS:
+            if depth:
+                depth -= 1
+                angle_depth = outer_angle_depths.pop()
+        elif ch == '<':
+            if _opens_template(text, i):
+                angle_depth += 1
+        elif ch == '>':
+            if angle_depth:
+                angle_depth -= 1
+        elif ch == sep and not depth:
+            if angle_depth:
+                # A '<' with no '>' to come was a comparison ('a<b'), not a template
+                if _template_closes_later(text, i):
+                    continue
+                angle_depth = 0
+            pieces.append(text[start:i].strip())
+            start = i + 1
+    pieces.append(text[start:].strip())
+    return pieces
+
+
+def _collect_decl(line: str, lines: List[str], start_idx: int) -> Tuple[List[str], int]:
+    """
+    Collect the lines of a declaration that may span several lines.
+
+    Lines are collected from start_idx until one contains ';' or '{'.
+
+    Args:
+        line (str): Stripped line at start_idx.
+        lines (List[str]): All lines from the file.
+        start_idx (int): Index of the first line of the declaration.
+
+    Returns:
+        Tuple[List[str], int]: Stripped parts (callers must not modify them) and the
+        index of the terminating line, or len(lines) if no terminator was found.
+    """
+    # Only the newest part needs checking for a terminator; parts are joined by the caller
+    parts = [line]
+    part = line
+    end_idx = start_idx
+    n = len(lines)
+    while end_idx < n and ';' not in part and '{' not in part:
+        end_idx += 1
+        if end_idx < n:
+            part = lines[end_idx].strip()
+            parts.append(part)
+    return parts, end_idx
+
+
+def _trim_trailing_blank_lines(output: List[str]) -> List[str]:
+    """Drop trailing blank entries in one slice deletion and end the output with a single newline."""
+    end = len(output)
+    while end and not output[end - 1].strip():
+        end -= 1
+    del output[end:]
+    output.append('\n')
+    return output
+
+
+def _parse_in_processes(worker: Callable[[str, bool], List[str]], filenames: Iterable[str],
+                        enhance_existing: bool, jobs: Optional[int]) -> Iterator[List[str]]:
+    """
+    Run worker(filename, enhance_existing) for each file in a process pool.
+
+    Args:
+        worker: Module-level (picklable) function parsing one file
+        filenames: Paths of the files, any iterable
+        enhance_existing: Passed on to every worker call
+        jobs: Number of worker processes (None = all CPUs but two, at least one)
+
+    Yields:
+        List[str]: Result of the worker for each file, in input order.
+    """
+    workers = jobs or max(1, (os.cpu_count() or 1) - 2)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(worker, filenames, repeat(enhance_existing), chunksize=4)
+
+
+def _parse_header_worker(filename: str, enhance_existing: bool) -> List[str]:
+    """parse_headers worker: parse one header with a new generator."""
+    return HeaderDoxygenGenerator(enhance_existing=enhance_existing).parse_header(filename)
 
 
 class HeaderDoxygenGenerator:
+    # Line prefixes that open an existing Doxygen comment
+    DOXYGEN_PREFIXES = ('/**', '///', '/*!')
+
     def __init__(self, enhance_existing: bool = False):
         """
         Initialize the HeaderDoxygenGenerator.
@@ -29,67 +314,96 @@ class HeaderDoxygenGenerator:
             ValueError: If the file extension is not a supported C++ header file.
         """
         # Only allow header files
-        ext = filename.split('.')[-1].lower()
-        if ext not in ["h", "hpp", "hh", "hxx"]:
+        ext = filename.rpartition('.')[2].lower()
+        if ext not in _HEADER_EXTENSIONS:
             raise ValueError("Only C++ header files are supported (.h, .hpp, .hh, .hxx)")
+        # One read and one split instead of line-by-line readline calls
         with open(filename, 'r') as f:
-            lines = f.readlines()
+            lines = f.read().splitlines(keepends=True)
+
+        return self.parse_header_from_lines(lines)
+
+    def parse_headers(self, filenames: Iterable[str], jobs: Optional[int] = None) -> Iterator[List[str]]:
+        """
+        Parse several C++ header files in parallel worker processes.
+
+        Each file is parsed by a fresh generator in a worker, so per-file state
+        (current_class, current_namespace) is not updated on this instance.
+
+        Args:
+            filenames (Iterable[str]): Paths to the header files.
+            jobs (Optional[int]): Number of worker processes (None = all CPUs but two).
+
+        Yields:
+            List[str]: Lines with Doxygen comments for each file, in input order.
+
+        Raises:
+            ValueError: If a file extension is not a supported C++ header file.
+        """
+        return _parse_in_processes(_parse_header_worker, filenames, self.enhance_existing, jobs)
+
+    def parse_header_from_lines(self, lines: List[str]) -> List[str]:
+        """
+        Add Doxygen comments to already loaded header lines.
+
+        Lets callers that already hold a header's contents skip the file read.
+
+        Args:
+            lines (List[str]): Lines of the header, each keeping its newline.
+
+        Returns:
+            List[str]: List of lines with Doxygen comments inserted.
+        """
+        # Class/namespace context belongs to a single file; don't carry it over
+        # from a previous parse when the generator is reused
+        self.current_class = None
+        self.current_namespace = None
 
         output = []
         i = 0
-        inside_class = False
         class_brace_depth = 0
-        last_was_decl = False
-
+        # Loop-invariant lookups, bound once instead of per line
+        n = len(lines)
+        match_function = self._match_function
+        match_variable = self._match_variable
 
         # Main parsing loop
-        while i < len(lines):
-            line = lines[i].rstrip('\n')
+        while i < n:
+            line = lines[i]
             stripped = line.strip()
 
             # Skip empty lines (preserve formatting)
             if not stripped:
-                output.append(lines[i])
-                last_was_decl = False
+                output.append(line)
                 i += 1
                 continue
 
-            # Handle existing Doxygen comments
-            if stripped.startswith('/**') or stripped.startswith('///') or stripped.startswith('/*!'):
-                if not self.enhance_existing:
-                    # Skip existing comments (default behavior)
-                    while i < len(lines) and '*/' not in lines[i]:
-                        output.append(lines[i])
-                        i += 1
-                    if i < len(lines):
-                        output.append(lines[i])
-                        i += 1
-                    last_was_decl = False
-                    continue
-                else:
-                    # Extract and enhance existing comment
-                    existing_comment_lines = []
-                    comment_start = i
-                    while i < len(lines) and '*/' not in lines[i]:
-                        existing_comment_lines.append(lines[i])
-                        i += 1
-                    if i < len(lines):
-                        existing_comment_lines.append(lines[i])
-                        i += 1
+            # Existing Doxygen comments are kept as-is (in both skip and enhance mode)
+            if stripped.startswith(self.DOXYGEN_PREFIXES):
+                end = self._doxygen_comment_end(lines, i)
+                output.extend(lines[i:end])
+                i = end
+                continue
 
-                    # Keep the existing comment but mark that we should enhance the following declaration
-                    output.extend(existing_comment_lines)
-                    last_was_decl = False
-                    continue
+            # Lines that cannot open a namespace, class, enum or function (preprocessor
+            # directives, plain comments, stray punctuation) are copied without matching
+            first = stripped[0]
+            if not (first.isalnum() or first in '_~:<>}'):
+                output.append(line)
+                i += 1
+                continue
+
+            # Classify namespace/class/enum openers with one regex match, run only
+            # for lines that start with one of their keywords
+            line_match = stripped.startswith(_OPENER_PREFIXES) and _LINE_CLASSIFIER_RE.match(stripped)
+            kind = line_match.lastgroup if line_match else None
 
             # Handle namespace declaration (track for context)
-            namespace_match = re.match(r'namespace\s+(\w+)\s*\{', stripped)
-            if namespace_match:
-                self.current_namespace = namespace_match.group(1)
+            if kind == 'ns':
+                self.current_namespace = line_match.group('ns_name')
                 if output and output[-1].strip():
                     output.append('\n')
-                output.append(lines[i])
-                last_was_decl = True
+                output.append(line)
                 i += 1
                 continue
 
@@ -100,21 +414,19 @@ class HeaderDoxygenGenerator:
             class_decl_found = False
             class_type = None
             class_name = None
-            class_decl_pattern = r'^(class|struct)\s+(\w+)(.*)$'
-            match = re.match(class_decl_pattern, stripped)
-            if match:
-                class_type = match.group(1)
-                class_name = match.group(2)
-                class_decl_lines.append(lines[i])
+            if kind == 'cls':
+                class_type = line_match.group('cls_type')
+                class_name = line_match.group('cls_name')
+                class_decl_lines.append(line)
                 # Check if { is present, else look ahead
                 if '{' in stripped:
                     class_decl_found = True
                 else:
                     j = i + 1
-                    while j < len(lines):
+                    while j < n:
                         next_line = lines[j].strip()
                         class_decl_lines.append(lines[j])
-                        if next_line.startswith('//') or next_line.startswith('/*'):
+                        if next_line.startswith(('//', '/*')):
                             break  # Don't cross over comments
                         if '{' in next_line:
                             class_decl_found = True
@@ -125,172 +437,167 @@ class HeaderDoxygenGenerator:
                         j += 1
             if class_decl_found and class_type and class_name:
                 self.current_class = class_name
-                inside_class = True
                 class_brace_depth = 1
                 indent = self._get_indent(class_decl_lines[0])
                 if output and output[-1].strip():
                     output.append('\n')
                 doc_comment = self._generate_class_comment(class_name, class_type, indent)
                 output.extend(doc_comment)
-                for l in class_decl_lines:
-                    output.append(l)
+                output.extend(class_decl_lines)
                 output.append('\n')
                 i = class_decl_start + len(class_decl_lines)
-                last_was_decl = True
                 # Process class body
-                prev_was_access_specifier = False
-                skip_next_comment = False
                 in_function_body = 0  # Track if inside a function body (brace depth)
-                prev_access_specifier_line = None
-                while i < len(lines) and inside_class:
-                    line = lines[i].rstrip('\n')
+                while i < n:
+                    line = lines[i]
                     stripped = line.strip()
-                    class_brace_depth += stripped.count('{')
-                    class_brace_depth -= stripped.count('}')
-                    # Handle access specifiers - output immediately and mark for next declaration
-                    if re.match(r'^(public|private|protected)\s*:\s*$', stripped):
-                        output.append(lines[i])
-                        prev_access_specifier_line = True  # Mark that we just output an access specifier
+                    brace_delta = _brace_delta(stripped)
+                    class_brace_depth += brace_delta
+                    # Handle access specifiers - output immediately
+                    # (stripped lines end in ':' for those, so most lines skip the regex)
+                    if stripped.endswith(':') and _ACCESS_RE.match(stripped):
+                        output.append(line)
                         i += 1
-                        last_was_decl = False
                         continue
                     # Track if inside a function body
                     if in_function_body > 0:
-                        in_function_body += stripped.count('{')
-                        in_function_body -= stripped.count('}')
-                        output.append(lines[i])
+                        in_function_body += brace_delta
+                        output.append(line)
                         i += 1
                         continue
 
                     # Skip blank lines and simple lines that can't be function declarations
-                    if not stripped or stripped.startswith('//') or stripped.startswith('#'):
-                        output.append(lines[i])
+                    if not stripped or stripped.startswith(('//', '#')):
+                        output.append(line)
+                        i += 1
+                        continue
+
+                    # Neither a function nor a variable starts with any other character
+                    # (braces, block-comment text); such a line is a regular one unless
+                    # it closes the class
+                    first = stripped[0]
+                    if class_brace_depth and not (first.isalnum() or first in '_~:<>'):
+                        output.append(line)
                         i += 1
                         continue
 
-                    # Try to match function (declaration or definition)
-                    func_match = self._match_function(stripped, lines, i)
+                    # Try to match function (declaration or definition); the declaration
+                    # lines are collected once and shared with the variable match below
+                    decl = _collect_decl(stripped, lines, i)
+                    func_match = match_function(stripped, lines, i, decl)
                     if func_match:
                         func_decl, end_idx = func_match
-                        indent = self._get_indent(lines[i])
+                        indent = self._get_indent(line)
                         # Clean up return_type: remove all C++ keywords
                         ret_type = func_decl.get('return_type', '').strip()
-                        ret_type = re.sub(r'\b(?:virtual|inline|explicit|constexpr|static|friend|mutable|volatile|register|extern|thread_local|auto|typename|override|final)\b', '', ret_type)
-                        ret_type = re.sub(r'\s+', ' ', ret_type).strip()
+                        ret_type = _RET_TYPE_STRIP_RE.sub('', ret_type)
+                        ret_type = ' '.join(ret_type.split())
                         func_decl['return_type'] = ret_type
 
                         # Generate and output comment with proper indentation
-                        doc_comment = self._generate_function_comment(func_decl, indent)
-                        for line_comment in doc_comment:
-                            output.append(line_comment.rstrip('\n') + '\n')
+                        output.extend(self._generate_function_comment(func_decl, indent))
 
                         # Output the function declaration
-                        for idx in range(i, end_idx + 1):
-                            output.append(lines[idx])
-                        if '{' in ''.join(lines[i:end_idx+1]):
+                        output.extend(lines[i:end_idx + 1])
+                        if any('{' in lines[k] for k in range(i, end_idx + 1)):
                             in_function_body = 1
                         i = end_idx + 1
-                        last_was_decl = True
-                        prev_access_specifier_line = None  # Reset after processing
                         continue
                     # Try to match variable (including those with default values, e.g. int x = 0;)
-                    var_match = self._match_variable(stripped, lines, i)
+                    var_match = match_variable(stripped, lines, i, decl)
                     if var_match:
                         var_decl, end_idx = var_match
-                        indent = self._get_indent(lines[i])
-                        # Only add comment if previous line is not an access specifier and not flagged to skip
-                        if output and output[-1].strip() and not prev_was_access_specifier and not skip_next_comment:
+                        indent = self._get_indent(line)
+                        if output and output[-1].strip():
                             output.append('\n')
-                        if not prev_was_access_specifier and not skip_next_comment:
-                            # Remove access specifier prefix from type if present
-                            if var_decl.get('type'):
-                                for spec in ('public:', 'private:', 'protected:'):
-                                    if var_decl['type'].startswith(spec):
-                                        var_decl['type'] = var_decl['type'][len(spec):].strip()
-                            doc_comment = self._generate_variable_comment(var_decl, indent)
-                            if doc_comment:
-                                output.extend(doc_comment)
-                        for idx in range(i, end_idx + 1):
-                            output.append(lines[idx])
+                        # Remove access specifier prefix from type if present
+                        if var_decl.get('type'):
+                            for spec in ('public:', 'private:', 'protected:'):
+                                if var_decl['type'].startswith(spec):
+                                    var_decl['type'] = var_decl['type'][len(spec):].strip()
+                        doc_comment = self._generate_variable_comment(var_decl, indent)
+                        if doc_comment:
+                            output.extend(doc_comment)
+                        output.extend(lines[i:end_idx + 1])
                         output.append('\n')
                         i = end_idx + 1
-                        last_was_decl = True
-                        prev_was_access_specifier = False
-                        skip_next_comment = False
                         continue
                     # End of class
                     if class_brace_depth == 0:
-                        inside_class = False
                         self.current_class = None
-                        output.append(lines[i])
+                        output.append(line)
                         output.append('\n')
                         i += 1
-                        last_was_decl = True
                         break
                     # Regular line in class
-                    output.append(lines[i])
+                    output.append(line)
                     i += 1
-                    last_was_decl = False
-                    prev_was_access_specifier = False
-                    skip_next_comment = False
                 continue
 
             # Handle function declarations (outside class)
-            func_match = self._match_function(stripped, lines, i)
+            func_match = match_function(stripped, lines, i)
             if func_match:
                 func_decl, end_idx = func_match
-                indent = self._get_indent(lines[i])
+                indent = self._get_indent(line)
                 if output and output[-1].strip():
                     output.append('\n')
-                doc_comment = self._generate_function_comment(func_decl, indent)
-                output.extend(doc_comment)
-                for idx in range(i, end_idx + 1):
-                    output.append(lines[idx])
+                output.extend(self._generate_function_comment(func_decl, indent))
+                output.append('\n')
+                output.extend(lines[i:end_idx + 1])
                 output.append('\n')
                 i = end_idx + 1
-                last_was_decl = True
                 continue
 
             # Handle enum declaration
-            enum_match = re.match(r'enum\s+(?:class\s+)?(\w+)\s*(?::\s*\w+)?\s*\{', stripped)
-            if enum_match:
-                indent = self._get_indent(lines[i])
+            if kind == 'enum':
+                indent = self._get_indent(line)
                 if output and output[-1].strip():
                     output.append('\n')
-                doc_comment = self._generate_enum_comment(enum_match.group(1), indent)
+                doc_comment = self._generate_enum_comment(line_match.group('enum_name'), indent)
                 output.extend(doc_comment)
-                output.append(lines[i])
+                output.append(line)
                 output.append('\n')
                 i += 1
-                last_was_decl = True
                 continue
 
 
-            # Handle closing braces for namespace/class
-            if stripped == '}' and (self.current_class or self.current_namespace):
-                if ';' in stripped:
-                    if self.current_class:
-                        self.current_class = None
-                    else:
-                        self.current_namespace = None
-                output.append(lines[i])
+            # Handle closing braces for namespace/class; '};' ends a class, struct
+            # or enum (never a namespace), so only the class context is left
+            if stripped in ('}', '};') and (self.current_class or self.current_namespace):
+                if stripped == '};':
+                    self.current_class = None
+                output.append(line)
                 output.append('\n')
                 i += 1
-                last_was_decl = True
                 continue
 
             # Regular line - just add it
-            output.append(lines[i])
-            last_was_decl = False
+            output.append(line)
             i += 1
 
         # Remove trailing blank lines for clean output
-        while output and not output[-1].strip():
-            output.pop()
-        output.append('\n')
-        return output
+        return _trim_trailing_blank_lines(output)
+
+    def _doxygen_comment_end(self, lines: List[str], start_idx: int) -> int:
+        """
+        Find the end of an existing Doxygen comment.
+
+        Args:
+            lines (List[str]): All lines in the file.
+            start_idx (int): Index of the line that opens the comment.
+
+        Returns:
+            int: Index just past the line containing the closing '*/'
+                 (len(lines) if the comment is never closed).
+        """
+        i = start_idx
+        n = len(lines)
+        while i < n and '*/' not in lines[i]:
+            i += 1
+        return min(i + 1, n)
 
-    def _match_function(self, line: str, lines: List[str], start_idx: int) -> Optional[Tuple[Dict, int]]:
+    def _match_function(self, line: str, lines: List[str], start_idx: int,
+                        decl: Optional[Tuple[List[str], int]] = None) -> Optional[Tuple[Dict, int]]:
         """
         Try to match a function declaration starting at start_idx, including constructors and destructors.
 
@@ -298,17 +605,20 @@ class HeaderDoxygenGenerator:
             line (str): Current line.
             lines (List[str]): All lines from the file.
             start_idx (int): Index of the current line.
+            decl (Optional[Tuple[List[str], int]]): Result of _collect_decl for this line, if
+                the caller already has it.
 
         Returns:
             Optional[Tuple[Dict, int]]: Tuple of function info dict and end index, or None if not a function.
         """
+        # Cheap reject: a declaration starts with an identifier, '~' or a scope/template token,
+        # so preprocessor lines, comments and braces never need the multi-line join below
+        if not line or not (line[0].isalnum() or line[0] in '_~:<>'):
+            return None
+
         # Handle multi-line function declarations (join lines until ; or {)
-        full_decl = line
-        end_idx = start_idx
-        while end_idx < len(lines) and ';' not in full_decl and '{' not in full_decl:
-            end_idx += 1
-            if end_idx < len(lines):
-                full_decl += ' ' + lines[end_idx].strip()
+        parts, end_idx = decl or _collect_decl(line, lines, start_idx)
+        full_decl = ' '.join(parts)
 
         if '{' in full_decl:
             full_decl = full_decl[:full_decl.index('{')].strip()
@@ -317,6 +627,12 @@ class HeaderDoxygenGenerator:
         else:
             return None
 
+        # Every function declaration has a parameter list
+        if '(' not in full_decl:
+            return None
+
+        current_class = self.current_class
+
         # Detect assignment operator (copy/move)
         is_assignment = False
         assignment_type = None
@@ -324,22 +640,16 @@ class HeaderDoxygenGenerator:
             # Only skip if it's not a copy/move assignment
             is_assignment = True
             # Try to detect copy/move assignment
-            if self.current_class:
+            if current_class:
                 # e.g. ClassName& operator=(const ClassName&) or ClassName& operator=(ClassName&&)
-                if re.search(r'operator\s*=\s*\((const\s+' + re.escape(self.current_class) + r'\s*&|'+re.escape(self.current_class)+r'\s*&&)', full_decl):
+                if _class_patterns(current_class).assign.search(full_decl):
                     assignment_type = 'copy' if 'const' in full_decl else 'move'
             # If not copy/move assignment, skip
             if not assignment_type:
                 return None
 
         # Match function declaration using regex (also matches ctors/dtors)
-        pattern = r'(?:(?:virtual|static|inline|explicit|constexpr)\s+)*' \
-                  r'(?:[\w:<>]+\s+)*' \
-                  r'(~?\w+|operator=)\s*\((.*?)\)\s*(?:const\s*)?' \
-                  r'(?:noexcept\s*(?:\([^)]*\))?\s*)?' \
-                  r'(?:\=\s*(?:default|delete|\d+))?\s*'
-
-        match = re.match(pattern, full_decl)
+        match = _FUNC_RE.match(full_decl)
         if not match:
             return None
 
@@ -347,17 +657,20 @@ class HeaderDoxygenGenerator:
         params = match.group(2)
 
         # Try to extract return type (for constructors/destructors, this will be empty)
-        ret_type_match = re.match(r'(?:(?:virtual|static|inline|explicit|constexpr)\s+)*((?:[\w:<>]+\s+)*)' + re.escape(func_name) + r'\s*\(', full_decl)
+        ret_type_match = _ret_type_pattern(func_name).match(full_decl)
         return_type = ret_type_match.group(1).strip() if ret_type_match else ''
 
         # Parse parameters (type and name)
         param_list = []
         if params:
-            for p in [p.strip() for p in params.split(',')]:
+            for p in _split_top_level(params):
                 if not p:
                     continue
-                # Handle default values
-                p = re.sub(r'\s*=\s*.*$', '', p)
+                # Handle default values: drop everything from the first '=' (a slice
+                # rather than a regex, whose \s*= backtracks quadratically on long
+                # whitespace runs)
+                if '=' in p:
+                    p = p[:p.index('=')].rstrip()
                 # Get type and name
                 parts = p.rsplit(' ', 1)
                 if len(parts) == 1:
@@ -372,23 +685,23 @@ class HeaderDoxygenGenerator:
 
         # Check for throw specification (older C++ style)
         throw_spec = None
-        throw_match = re.search(r'throw\s*\((.*?)\)', full_decl)
+        throw_match = _THROW_SPEC_RE.search(full_decl) if 'throw' in full_decl else None
         if throw_match:
             throw_spec = [t.strip() for t in throw_match.group(1).split(',') if t.strip()]
 
         # Detect if this is a constructor or destructor
-        is_ctor = self.current_class and (func_name == self.current_class)
-        is_dtor = self.current_class and (func_name == f'~{self.current_class}')
+        is_ctor = current_class and (func_name == current_class)
+        is_dtor = current_class and (func_name == f'~{current_class}')
 
         # Detect copy/move constructor
         is_copy_ctor = False
         is_move_ctor = False
-        if self.current_class and func_name == self.current_class and param_list:
+        if current_class and func_name == current_class and param_list:
             # Copy: const ClassName&
-            if len(param_list) == 1 and re.match(r'const\s+' + re.escape(self.current_class) + r'\s*&', param_list[0][0]):
+            if len(param_list) == 1 and _class_patterns(current_class).copy_ctor.match(param_list[0][0]):
                 is_copy_ctor = True
             # Move: ClassName&&
-            elif len(param_list) == 1 and re.match(re.escape(self.current_class) + r'\s*&&', param_list[0][0]):
+            elif len(param_list) == 1 and _class_patterns(current_class).move_ctor.match(param_list[0][0]):
                 is_move_ctor = True
 
         # Detect copy/move assignment operator
@@ -402,7 +715,7 @@ class HeaderDoxygenGenerator:
             'noexcept': noexcept,
             'throw': throw_spec,
             'static': 'static' in full_decl,
-            'const': 'const' in full_decl.split(')')[-1],
+            'const': 'const' in full_decl.rpartition(')')[2],
             'full_decl': full_decl,
             'is_ctor': is_ctor,
             'is_dtor': is_dtor,
@@ -413,34 +726,49 @@ class HeaderDoxygenGenerator:
         }, end_idx
 
 
-    def _match_variable(self, line: str, lines: List[str], start_idx: int) -> Optional[Tuple[Dict, int]]:
+    def _match_variable(self, line: str, lines: List[str], start_idx: int,
+                        decl: Optional[Tuple[List[str], int]] = None) -> Optional[Tuple[Dict, int]]:
         """
         Try to match a variable declaration starting at start_idx.
         Args:
             line (str): Current line.
             lines (List[str]): All lines from the file.
             start_idx (int): Index of the current line.
+            decl (Optional[Tuple[List[str], int]]): Result of _collect_decl for this line, if
+                the caller already has it.
         Returns:
             Optional[Tuple[Dict, int]]: Tuple of variable info dict and end index, or None if not a variable.
         """
+        # Cheap reject: a variable declaration starts with a type name (or a '::' scope),
+        # so comment continuations, braces and preprocessor lines never reach the checks below
+        if not line or not (line[0].isalpha() or line[0] in '_:'):
+            return None
+
         # Skip lines that are part of a function or other constructs
-        if any(s in line for s in ['{', '}', '(', ')', ';']) and not (';' in line and '=' not in line):
+        if not _DECL_PUNCT_CHARS.isdisjoint(line) and not (';' in line and '=' not in line):
             return None
 
         # Skip forward declarations and type/namespace/using/typedef declarations
         skip_prefixes = (
             'class ', 'struct ', 'enum ', 'namespace ', 'using ', 'typedef ', 'template ', 'friend ', 'public:', 'private:', 'protected:'
         )
-        if line.strip().startswith(skip_prefixes):
+        if line.startswith(skip_prefixes):
             return None
 
-        # Handle multi-line declarations (join lines until ;)
-        full_decl = line
-        end_idx = start_idx
-        while end_idx < len(lines) and ';' not in full_decl:
-            end_idx += 1
-            if end_idx < len(lines):
-                full_decl = f"{full_decl.rstrip()} {lines[end_idx].strip()}"
+        # Handle multi-line declarations (join lines until ;). The scan up to the first
+        # ; or { is the same as for functions; a variable only ends at ;, so continue past a {.
+        parts, end_idx = decl or _collect_decl(line, lines, start_idx)
+        n = len(lines)
+        if end_idx < n and ';' not in parts[-1]:
+            parts = list(parts)
+            part = parts[-1]
+            while end_idx < n and ';' not in part:
+                end_idx += 1
+                if end_idx < n:
+                    part = lines[end_idx].strip()
+                    parts.append(part)
+        # Blank lines add nothing to the declaration, so they are left out of the join
+        full_decl = ' '.join([parts[0].rstrip()] + [part for part in parts[1:] if part])
 
         if ';' not in full_decl:
             return None
@@ -451,12 +779,7 @@ class HeaderDoxygenGenerator:
         if full_decl.startswith(skip_prefixes):
             return None
 
-        # Updated regex pattern for variable declarations
-        pattern = r'(?:(?:static|constexpr|mutable|inline)\s+)?' \
-                  r'(?:const\s+)?' \
-                  r'(.+?)\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:=\s*.*)?$'
-
-        match = re.match(pattern, full_decl)
+        match = _VAR_RE.match(full_decl)
         if not match:
             return None
 
@@ -495,14 +818,13 @@ class HeaderDoxygenGenerator:
         Returns:
             List[str]: Doxygen comment lines.
         """
-        comment = [
-            f"{indent}/**",
-            f"{indent} * @brief {class_type} {class_name}",
-            f"{indent} *",
-            f"{indent} * @details Detailed description of {class_type} {class_name}",
-            f"{indent} */"
+        return [
+            f'{indent}/**\n',
+            f'{indent} * @brief {class_type} {class_name}\n',
+            f'{indent} *\n',
+            f'{indent} * @details Detailed description of {class_type} {class_name}\n',
+            f'{indent} */\n'
         ]
-        return [line + "\n" for line in comment]
 
     def _generate_function_comment(self, func: Dict, indent: str = "") -> List[str]:
         """
@@ -512,53 +834,53 @@ class HeaderDoxygenGenerator:
         for spec in ('public:', 'private:', 'protected:'):
             if ret_type.startswith(spec):
                 ret_type = ret_type[len(spec):].strip()
-        ret_type = re.sub(r'^(virtual|inline|explicit|constexpr|static)\\s+', '', ret_type)
+        ret_type = _LEADING_SPECIFIER_RE.sub('', ret_type)
 
-        comment = [f'{indent}/**']
+        comment = [f'{indent}/**\n']
 
         # Brief description
         if func.get('is_copy_ctor'):
-            comment.append(f"{indent} * @brief Copy constructor for {self.current_class}")
+            comment.append(f"{indent} * @brief Copy constructor for {self.current_class}\n")
         elif func.get('is_move_ctor'):
-            comment.append(f"{indent} * @brief Move constructor for {self.current_class}")
+            comment.append(f"{indent} * @brief Move constructor for {self.current_class}\n")
         elif func.get('is_copy_assign'):
-            comment.append(f"{indent} * @brief Copy assignment operator for {self.current_class}")
+            comment.append(f"{indent} * @brief Copy assignment operator for {self.current_class}\n")
         elif func.get('is_move_assign'):
-            comment.append(f"{indent} * @brief Move assignment operator for {self.current_class}")
+            comment.append(f"{indent} * @brief Move assignment operator for {self.current_class}\n")
         elif func.get('is_ctor'):
-            comment.append(f"{indent} * @brief Constructor for {self.current_class}")
+            comment.append(f"{indent} * @brief Constructor for {self.current_class}\n")
         elif func.get('is_dtor'):
-            comment.append(f"{indent} * @brief Destructor for {self.current_class}")
+            comment.append(f"{indent} * @brief Destructor for {self.current_class}\n")
         else:
-            comment.append(f"{indent} * @brief {self._generate_brief_description(func['name'])}")
+            comment.append(f"{indent} * @brief {self._generate_brief_description(func['name'])}\n")
 
         # Detailed description
-        comment.append(f'{indent} * @details')
+        comment.append(f'{indent} * @details\n')
 
         # Parameters
         for param_type, param_name in func['params']:
             if param_name:
                 clean_name = param_name.lstrip('&*')
-                comment.append(f'{indent} * @param {clean_name}')
+                comment.append(f'{indent} * @param {clean_name}\n')
 
         # Return value
         if not func.get('is_ctor') and not func.get('is_dtor') and ret_type not in ('void', ''):
-            comment.append(f'{indent} * @return {ret_type}')
+            comment.append(f'{indent} * @return {ret_type}\n')
 
         # Exceptions
         if func['throw']:
             for exc in func['throw']:
-                comment.append(f'{indent} * @throws {exc}')
+                comment.append(f'{indent} * @throws {exc}\n')
         elif not func['noexcept']:
-            comment.append(f'{indent} * @throws std::exception on error')
+            comment.append(f'{indent} * @throws std::exception on error\n')
 
         if func['static']:
-            comment.append(f'{indent} * @static')
+            comment.append(f'{indent} * @static\n')
         if func['const']:
-            comment.append(f'{indent} * @const')
+            comment.append(f'{indent} * @const\n')
 
         comment.append(f'{indent} */\n')
-        return [line + '\n' for line in comment]
+        return comment
 
     def _generate_enum_comment(self, enum_name: str, indent: str = "") -> List[str]:
         """
@@ -631,37 +953,5 @@ class HeaderDoxygenGenerator:
         if is_var:
             return f"Variable {name}"
 
-        # Convert camelCase or snake_case to readable text
-        readable = re.sub(r'([A-Z])', r' \1', name)
-        readable = readable.replace('_', ' ')
-        readable = readable.lower().capitalize()
-
-        # Common prefixes for function names
-        prefixes = {
-            'get': 'Gets the ',
-            'set': 'Sets the ',
-            'is': 'Checks if ',
-            'has': 'Checks if has ',
-            'create': 'Creates a new ',
-            'init': 'Initializes the ',
-            'update': 'Updates the ',
-            'delete': 'Deletes the ',
-            'remove': 'Removes the ',
-            'add': 'Adds a new ',
-            'find': 'Finds the ',
-            'calculate': 'Calculates the ',
-            'compute': 'Computes the ',
-        }
-
-        for prefix, desc in prefixes.items():
-            if name.lower().startswith(prefix):
-                rest = name[len(prefix):]
-                if not rest:
-                    return desc[:-1]
-                rest_readable = re.sub(r'([A-Z])', r' \1', rest)
-                rest_readable = rest_readable.replace('_', ' ')
-                rest_readable = rest_readable.lower()
-                return desc + rest_readable
-
-        return readable
+        return _function_brief(name)
 
@@ -22,6 +22,8 @@ def main():
     parser.add_argument("--enhance-existing", action="store_true", help="Enhance existing Doxygen comments instead of skipping them")
     parser.add_argument("--recursive", action="store_true", default=True, help="Process directories recursively (default: True)")
     parser.add_argument("--no-recursive", dest="recursive", action="store_false", help="Don't process directories recursively")
+    parser.add_argument("--incremental", action="store_true", help="Skip files unchanged since the last directory/project run (cache kept in .doxygen_gen_cache.json)")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Worker processes for directory/project mode (default: 1, 0 = one per CPU)")
 
 
     args = parser.parse_args()
@@ -29,7 +31,7 @@ def main():
     try:
         from generator.header.header_generator import HeaderDoxygenGenerator
         from generator.cpp.cpp_generator import CppSourceGenerator
-        from generator.directory_processor import DirectoryProcessor
+        from generator.directory_processor import DirectoryProcessor, CACHE_FILENAME
     except ImportError as e:
         print("Error importing generator modules:", e)
         sys.exit(2)
@@ -116,7 +118,11 @@ def main():
         # Check for directory or project mode
         if args.directory or args.project:
             # Directory processing mode
-            processor = DirectoryProcessor(enhance_existing=args.enhance_existing)
+            cache_path = None
+            if args.incremental:
+                cache_path = os.path.join(args.project or args.directory, CACHE_FILENAME)
+            processor = DirectoryProcessor(enhance_existing=args.enhance_existing, jobs=args.jobs,
+                                           cache_path=cache_path)
 
             try:
                 if args.project:
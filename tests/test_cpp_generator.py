@@ -5,11 +5,14 @@ Tests for C++ source file generator and test case analyzer.
 import unittest
 import sys
 import os
+import shutil
+import tempfile
 from unittest.mock import patch, mock_open
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
 from generator.cpp.cpp_generator import CppSourceGenerator
+from generator.header.header_generator import HeaderDoxygenGenerator
 from generator.analyzer import TestCaseAnalyzer, TestInfo
 
 
@@ -106,6 +109,75 @@ namespace Utils {
         self.assertTrue(any("namespace Utils" in line for line in result))
         self.assertTrue(any("@brief" in line for line in result))
 
+    def test_parallel_parsing_matches_single_file_parsing(self):
+        """Test that parse_files and parse_headers return the same output as per-file parsing, in order."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        sources = {
+            'math.cpp': "int add(int a, int b) {\n    return a + b;\n}\n",
+            'shape.h': "class Shape {\npublic:\n    double area() const;\n};\n",
+            'test_math.cpp': "#include <gtest/gtest.h>\nTEST(Math, Add) {\n    EXPECT_EQ(2, 1 + 1);\n}\n",
+        }
+        paths = []
+        for name, content in sources.items():
+            path = os.path.join(temp_dir, name)
+            with open(path, 'w') as f:
+                f.write(content)
+            paths.append(path)
+
+        # Any iterable of paths is accepted, not just a list
+        results = list(self.generator.parse_files(iter(paths), jobs=2))
+        expected = [CppSourceGenerator().parse_source(path) for path in paths]
+        self.assertEqual(results, expected)
+
+        headers = [path for path in paths if path.endswith('.h')]
+        results = list(HeaderDoxygenGenerator().parse_headers(path for path in headers))
+        expected = [HeaderDoxygenGenerator().parse_header(path) for path in headers]
+        self.assertEqual(results, expected)
+
+    def test_parse_from_lines_matches_parse_from_file(self):
+        """Test that parsing preloaded lines gives the same output as parsing the file."""
+        content = "#include <gtest/gtest.h>\nTEST(Math, Add) {\n    EXPECT_EQ(2, 1 + 1);\n}\n"
+        with patch("builtins.open", mock_open(read_data=content)):
+            expected = CppSourceGenerator().parse_source("test_math.cpp")
+
+        result = self.generator.parse_source_from_lines(content.splitlines(keepends=True))
+
+        self.assertEqual(result, expected)
+        self.assertEqual(self.generator.detected_framework, 'gtest')
+
+        content = "class Widget {\npublic:\n    int width() const;\n};\n"
+        with patch("builtins.open", mock_open(read_data=content)):
+            expected = HeaderDoxygenGenerator().parse_header("widget.h")
+
+        result = HeaderDoxygenGenerator().parse_header_from_lines(content.splitlines(keepends=True))
+
+        self.assertEqual(result, expected)
+
+    def test_parse_source_does_not_leak_context_between_files(self):
+        """Test that a reused generator parses each file like a fresh one."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        first = os.path.join(temp_dir, 'first.cpp')
+        second = os.path.join(temp_dir, 'second.cpp')
+        with open(first, 'w') as f:
+            f.write("namespace app {\nvoid run();\n")
+        with open(second, 'w') as f:
+            f.write("}\nint value = 0;\n")
+
+        self.generator.parse_source(first)
+        result = self.generator.parse_source(second)
+
+        self.assertEqual(result, CppSourceGenerator().parse_source(second))
+
+        # Same for headers parsed through HeaderDoxygenGenerator
+        header = HeaderDoxygenGenerator()
+        second_lines = ["}\n", "#define X 1\n", "void y();\n"]
+        header.parse_header_from_lines(["namespace app {\n", "void run();\n"])
+        result = header.parse_header_from_lines(second_lines)
+
+        self.assertEqual(result, HeaderDoxygenGenerator().parse_header_from_lines(second_lines))
+
 
 class TestTestCaseAnalyzer(unittest.TestCase):
     """Test cases for TestCaseAnalyzer."""
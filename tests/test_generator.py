@@ -5,7 +5,7 @@ from unittest.mock import patch, mock_open
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
-from generator.header.header_generator import HeaderDoxygenGenerator
+from generator.header.header_generator import HeaderDoxygenGenerator, _split_top_level
 
 class TestHeaderDoxygenGenerator(unittest.TestCase):
     @patch("builtins.open", new_callable=mock_open, read_data="""
@@ -197,6 +197,20 @@ private:
         self.assertIn("@return int", "".join(comment))
         self.assertTrue(all(line.startswith("  ") for line in comment if line.strip() and not line.strip().startswith('*/')))
 
+    def test_generate_function_comment_strips_leading_specifier(self):
+        func_info = {
+            "return_type": "virtual bool",
+            "name": "validate",
+            "params": [],
+            "noexcept": False,
+            "throw": None,
+            "static": False,
+            "const": True,
+        }
+        comment = "".join(self.generator._generate_function_comment(func_info))
+        self.assertIn("@return bool\n", comment)
+        self.assertNotIn("virtual", comment)
+
     def test_generate_enum_comment(self):
         comment = self.generator._generate_enum_comment("TestEnum", indent="\t")
         self.assertIn("@brief Enum TestEnum", comment[1])
@@ -209,6 +223,37 @@ private:
         self.assertIsNotNone(result)
         self.assertEqual(result[0]["name"], "testFunction")
 
+    def test_match_function_template_param_with_comma(self):
+        lines = ["void put(const std::map<int, std::string>& entries, int count);"]
+        result = self.generator._match_function(lines[0], lines, 0)
+        self.assertIsNotNone(result)
+        self.assertEqual(result[0]["params"], [("const std::map<int, std::string>&", "entries"), ("int", "count")])
+
+    def test_match_function_shift_and_comparison_defaults(self):
+        lines = ["void f(int flags = 1 << 2, bool x = false);"]
+        result = self.generator._match_function(lines[0], lines, 0)
+        self.assertIsNotNone(result)
+        self.assertEqual(result[0]["params"], [("int", "flags"), ("bool", "x")])
+        lines = ["int g(int a = 1 < 2, int b = 3, bool c = a<=b);"]
+        result = self.generator._match_function(lines[0], lines, 0)
+        self.assertIsNotNone(result)
+        self.assertEqual([name for _, name in result[0]["params"]], ["a", "b", "c"])
+        lines = ["void h(std::vector<std::pair<int, int>> d, int e = 1<2);"]
+        result = self.generator._match_function(lines[0], lines, 0)
+        self.assertIsNotNone(result)
+        self.assertEqual([name for _, name in result[0]["params"]], ["d", "e"])
+
+    def test_match_function_identifier_comparison_defaults(self):
+        lines = ["void f(int x = a<b, int y);"]
+        result = self.generator._match_function(lines[0], lines, 0)
+        self.assertIsNotNone(result)
+        self.assertEqual([name for _, name in result[0]["params"]], ["x", "y"])
+        self.assertEqual(_split_top_level("bool f = (a<b), int y"), ["bool f = (a<b)", "int y"])
+        lines = ["void h(int x = a<b, std::map<int, int> m);"]
+        result = self.generator._match_function(lines[0], lines, 0)
+        self.assertIsNotNone(result)
+        self.assertEqual([name for _, name in result[0]["params"]], ["x", "m"])
+
 
     def test_generate_brief_description(self):
         # Updated expected outputs to match latest implementation
@@ -243,6 +288,20 @@ class Test {};
         result_str = ''.join(result)
         self.assertIn('namespace MyNamespace', result_str)
 
+    @patch("builtins.open", new_callable=mock_open, read_data="""
+namespace MyNamespace {
+enum Color {
+    RED,
+};
+#define MAX 1
+}
+""")
+    def test_semicolon_closing_brace_in_namespace(self, mock_file):
+        """Test that '};' is handled like '}' as a closing brace inside a namespace."""
+        result = self.generator.parse_header("test.h")
+        result_str = ''.join(result)
+        self.assertIn('};\n\n#define MAX 1\n', result_str)
+
     @patch("builtins.open", new_callable=mock_open, read_data="""
 /**
  * @brief Existing comment for class
@@ -371,6 +430,37 @@ void functionWithLongParams(
         self.assertIn('functionWithLongParams', result_str)
 
 
+    @patch("builtins.open", new_callable=mock_open, read_data="""
+class Printer {
+public:
+    void open() {
+        write("{");
+    }
+    void close();
+};
+""")
+    def test_braces_in_string_literal_ignored(self, mock_file):
+        """Test that braces inside string literals do not end the class body early."""
+        result = self.generator.parse_header("test.h")
+        result_str = ''.join(result)
+        self.assertIn('@brief Close', result_str)
+
+
+    @patch("builtins.open", new_callable=mock_open, read_data="""
+class Counter {
+    /* note:
+     * keep count;
+     */
+    int count;
+};
+""")
+    def test_block_comment_lines_not_documented_as_variables(self, mock_file):
+        """Test that lines inside a plain block comment are not treated as variables."""
+        result = self.generator.parse_header("test.h")
+        result_str = ''.join(result)
+        self.assertEqual(result_str.count('@brief Variable count'), 1)
+        self.assertIn('     * keep count;\n     */\n', result_str)
+
 class TestSpecialMemberFunctions(unittest.TestCase):
     """Test special member function detection and documentation."""
 
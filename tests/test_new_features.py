@@ -2,6 +2,7 @@
 Tests for CppUnit support and new features added to the generator.
 """
 
+import json
 import unittest
 import sys
 import os
@@ -9,6 +10,7 @@ import platform
 from unittest.mock import patch, mock_open
 import tempfile
 import shutil
+from io import StringIO
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
@@ -132,6 +134,19 @@ class TestDirectoryProcessing(unittest.TestCase):
 
         self.assertEqual(len(files), 2)
 
+    def test_iter_cpp_files(self):
+        """Test lazy file discovery and eager directory validation."""
+        self.test_dir = tempfile.mkdtemp()
+        open(os.path.join(self.test_dir, 'main.cpp'), 'w').close()
+        open(os.path.join(self.test_dir, 'notes.md'), 'w').close()
+
+        files = self.processor.iter_cpp_files(self.test_dir)
+
+        self.assertNotIsInstance(files, list)
+        self.assertEqual([os.path.basename(f) for f in files], ['main.cpp'])
+        with self.assertRaises(ValueError):
+            self.processor.iter_cpp_files(os.path.join(self.test_dir, 'missing'))
+
     @unittest.skipIf(platform.system() == 'Windows', 'Skip on Windows due to path format issues')
     def test_process_directory_dry_run(self):
         """Test directory processing in dry-run mode."""
@@ -149,6 +164,40 @@ class TestDirectoryProcessing(unittest.TestCase):
         self.assertTrue(results[test_file][0])  # Success
         self.assertIn('dry run', results[test_file][1].lower())
 
+    def test_process_directory_parallel_matches_serial(self):
+        """Test that worker processes produce the same files and results as serial processing."""
+        self.test_dir = tempfile.mkdtemp()
+        with open(os.path.join(self.test_dir, 'shape.h'), 'w') as f:
+            f.write('class Shape {\npublic:\n    double area() const;\n};\n')
+        with open(os.path.join(self.test_dir, 'test_shape.cpp'), 'w') as f:
+            f.write('#include <gtest/gtest.h>\nTEST(Shape, Area) {\n    EXPECT_EQ(1, 1);\n}\n')
+        serial_dir = os.path.join(self.test_dir, 'serial')
+        parallel_dir = os.path.join(self.test_dir, 'parallel')
+
+        with patch('sys.stdout', new=StringIO()):
+            serial = self.processor.process_directory(self.test_dir, output_dir=serial_dir, recursive=False)
+            parallel = DirectoryProcessor(jobs=2).process_directory(
+                self.test_dir, output_dir=parallel_dir, recursive=False)
+
+        self.assertEqual(serial, parallel)
+        for name in ('shape.h', 'test_shape.cpp'):
+            with open(os.path.join(serial_dir, name)) as f1, open(os.path.join(parallel_dir, name)) as f2:
+                self.assertEqual(f1.read(), f2.read())
+
+    def test_process_directory_results_sorted(self):
+        """Test that results are reported in path order, whatever the walk order."""
+        self.test_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.test_dir, 'sub'))
+        for name in ('zeta.h', 'alpha.cpp', 'sub/mid.h', 'beta.hpp', 'omega.cc'):
+            with open(os.path.join(self.test_dir, name), 'w') as f:
+                f.write('class Test {};\n')
+
+        with patch('sys.stdout', new=StringIO()) as out:
+            results = self.processor.process_directory(self.test_dir, dry_run=True)
+
+        self.assertEqual(list(results), sorted(results))
+        self.assertIn('Found 5 C++ file(s) to process', out.getvalue())
+
     def test_skip_build_directories(self):
         """Test that build directories are skipped."""
         self.test_dir = tempfile.mkdtemp()
@@ -492,5 +541,63 @@ class TestDirectoryProcessorExtended(unittest.TestCase):
         self.assertIn(test_file, results)
 
 
+    @unittest.skipIf(platform.system() == 'Windows', 'Skip on Windows due to path format issues')
+    def test_process_directory_incremental_cache(self):
+        """Test that unchanged files are skipped on the next run and changed files are reprocessed."""
+        self.test_dir = tempfile.mkdtemp()
+        src_dir = os.path.join(self.test_dir, 'src')
+        os.makedirs(src_dir)
+        test_file = os.path.join(src_dir, 'test.h')
+        with open(test_file, 'w') as f:
+            f.write('class Test {};\n')
+        cache_path = os.path.join(self.test_dir, 'cache.json')
+
+        with patch('sys.stdout', new=StringIO()):
+            first = DirectoryProcessor(cache_path=cache_path).process_directory(src_dir, recursive=False)
+            second = DirectoryProcessor(cache_path=cache_path).process_directory(src_dir, recursive=False)
+            with open(test_file, 'a') as f:
+                f.write('void added();\n')
+            third = DirectoryProcessor(cache_path=cache_path).process_directory(src_dir, recursive=False)
+
+        self.assertEqual(first[test_file][1], "Processed successfully")
+        self.assertIn('skipped', second[test_file][1])
+        self.assertEqual(third[test_file][1], "Processed successfully")
+
+    @unittest.skipIf(platform.system() == 'Windows', 'Skip on Windows due to path format issues')
+    def test_process_directory_cache_invalidated_by_generator_change(self):
+        """Test that a cache written by a different generator version is ignored."""
+        self.test_dir = tempfile.mkdtemp()
+        src_dir = os.path.join(self.test_dir, 'src')
+        os.makedirs(src_dir)
+        test_file = os.path.join(src_dir, 'test.h')
+        with open(test_file, 'w') as f:
+            f.write('class Test {};\n')
+        cache_path = os.path.join(self.test_dir, 'cache.json')
+
+        with patch('sys.stdout', new=StringIO()):
+            DirectoryProcessor(cache_path=cache_path).process_directory(src_dir, recursive=False)
+            with patch('generator.directory_processor._generator_hash', return_value='upgraded'):
+                second = DirectoryProcessor(cache_path=cache_path).process_directory(src_dir, recursive=False)
+
+        self.assertEqual(second[test_file][1], "Processed successfully")
+
+    @unittest.skipIf(platform.system() == 'Windows', 'Skip on Windows due to path format issues')
+    def test_process_directory_ignores_malformed_cache(self):
+        """Test that a cache file whose entries are not a mapping is ignored."""
+        self.test_dir = tempfile.mkdtemp()
+        src_dir = os.path.join(self.test_dir, 'src')
+        os.makedirs(src_dir)
+        test_file = os.path.join(src_dir, 'test.h')
+        with open(test_file, 'w') as f:
+            f.write('class Test {};\n')
+        cache_path = os.path.join(self.test_dir, 'cache.json')
+        with open(cache_path, 'w') as f:
+            json.dump({'version': DirectoryProcessor()._cache_key(), 'files': []}, f)
+
+        with patch('sys.stdout', new=StringIO()):
+            results = DirectoryProcessor(cache_path=cache_path).process_directory(src_dir, recursive=False)
+
+        self.assertEqual(results[test_file][1], "Processed successfully")
+
 if __name__ == "__main__":
     unittest.main()